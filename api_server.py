@@ -1,18 +1,27 @@
 """
 BlogDex 등급 조회 API 서버
-FastAPI 기반, 동시 최대 3개 브라우저 병렬 처리
+FastAPI 기반, 드라이버 풀 크기에 맞춰 브라우저 병렬 처리 (기본 3개, 부하에 따라 증설)
 """
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, HttpUrl
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, HttpUrl
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-import threading
-from typing import List, Optional
-from crawler import crawl_blog_grade, crawl_blog_grade_with_pool
+import json
+from typing import Any, Dict, List, Literal, Optional
+from crawler import crawl_blog_grade_with_pool, crawl_blog_grade_with_tabs, crawl_blog_grade_http, check_http_mode_config, CRAWL_MODE
 from driver_pool import driver_pool
+from tab_pool import tab_pool
+from crawl_executor import crawl_executor, AdaptiveLimiter
+from result_cache import result_cache
+from job_queue import job_manager, QueueFullError
+from result_store import build_blog_id, result_writer
+from sqlite_store import result_db
+from export_results import EXPORT_FORMATS, iter_export
+from datetime import datetime
+from http_client import blogdex_http
+from session_manager import session_manager
 import time
 import logging
 
@@ -42,30 +51,60 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 병렬 처리 제한 (최대 3개)
-MAX_CONCURRENT_CRAWLS = 3
-semaphore = asyncio.Semaphore(MAX_CONCURRENT_CRAWLS)
+# 드라이버 1개당 동시 처리 수 (TABS_PER_DRIVER > 1이면 탭 공유 크롤링)
+SLOTS_PER_DRIVER = tab_pool.tabs_per_driver
+crawl_function = crawl_blog_grade_with_tabs if tab_pool.enabled else crawl_blog_grade_with_pool
 
-# 중복 요청 방지
-crawling_urls = set()
-crawling_lock = threading.Lock()
+# 병렬 처리 제한 (현재 드라이버 풀 크기 × 드라이버당 탭 수를 따라감)
+semaphore = AdaptiveLimiter(lambda: driver_pool.size * SLOTS_PER_DRIVER)
+
+# 스트리밍 일괄 조회 시 동시에 대기시킬 최대 작업 수
+STREAM_WINDOW = driver_pool.max_size * SLOTS_PER_DRIVER * 2
+
+# 크롤링 1건 제한 시간 (초, 지나면 응답은 504, 작업 스레드는 다음 단계에서 중단)
+CRAWL_TIMEOUT = 180
+
+# 중복 요청 병합 (blog_id → 진행 중인 크롤링 Task)
+inflight_crawls: Dict[str, asyncio.Task] = {}
 
 # 서버 시작/종료 이벤트
 @app.on_event("startup")
 async def startup_event():
     """서버 시작 시 드라이버 풀 초기화"""
     logger.info("서버 시작 - 드라이버 풀 초기화 시작...")
+    # 결과 저장 스레드 시작 (크롤링 스레드는 디스크 쓰기를 기다리지 않음)
+    result_writer.start()
+    check_http_mode_config()
+
     loop = asyncio.get_event_loop()
+    # 첫 드라이버가 준비되면 반환 (나머지는 백그라운드에서 병렬 준비)
     await loop.run_in_executor(None, driver_pool.initialize)
-    logger.info("드라이버 풀 초기화 완료")
+    logger.info("드라이버 풀 사용 가능 - 요청 수신 시작")
+
+    # 크롤링 실행기 시작 (드라이버 풀 최대 크기 × 드라이버당 탭 수만큼 스레드 유지)
+    crawl_executor.start(driver_pool.max_size * SLOTS_PER_DRIVER)
+
+    # 동시 실행 제한 대기열을 오토스케일링 판단에 사용
+    driver_pool.set_demand_probe(lambda: semaphore.waiting)
+
+    # 작업 큐 워커 시작 (동시 처리 가능한 최대 수만큼)
+    job_manager.start(resolve_grade, workers=driver_pool.max_size * SLOTS_PER_DRIVER)
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """서버 종료 시 드라이버 풀 정리"""
     logger.info("서버 종료 - 드라이버 풀 정리 시작...")
+    await job_manager.stop()
+    crawl_executor.shutdown()
+    blogdex_http.close()
     driver_pool.cleanup()
     logger.info("드라이버 풀 정리 완료")
 
+    # 대기 중인 결과를 모두 기록한 뒤 저장 스레드 종료
+    loop = asyncio.get_event_loop()
+    await loop.run_in_executor(None, result_writer.close)
+    logger.info(f"결과 저장 완료 ({result_writer.written}건 기록)")
+
 # HTTPException을 GradeResponse 형식으로 변환
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
@@ -96,18 +135,24 @@ async def http_exception_handler(request: Request, exc: HTTPException):
             "timestamp": None,
             "success": False,
             "error": exc.detail,
-            "file_path": None
+            "file_path": None,
+            "cached": False,
+            "raw": None
         }
     )
 
 # Pydantic 모델
 class GradeRequest(BaseModel):
     url: HttpUrl
-    
+    force_refresh: bool = False
+    max_age: Optional[int] = Field(None, ge=0)
+
     class Config:
         json_schema_extra = {
             "example": {
-                "url": "https://blog.naver.com/nyang2ne/224038751161"
+                "url": "https://blog.naver.com/nyang2ne/224038751161",
+                "force_refresh": False,
+                "max_age": 3600
             }
         }
 
@@ -124,6 +169,8 @@ class GradeResponse(BaseModel):
     success: bool
     error: Optional[str] = None
     file_path: Optional[str] = None
+    cached: bool = False
+    raw: Optional[Any] = None  # GRADE_CAPTURE_MODE=network일 때 BlogDex API 원본 응답
 
     class Config:
         json_schema_extra = {
@@ -138,13 +185,17 @@ class GradeResponse(BaseModel):
                 "tier_rank": 3,
                 "timestamp": "2025-11-19 19:30:45",
                 "success": True,
-                "file_path": "data/json_results/nyang2ne_grade_20251119_193045.json"
+                "file_path": "data/json_results/nyang2ne_grade_20251119_193045.json",
+                "cached": False
             }
         }
 
 class BatchGradeRequest(BaseModel):
     urls: List[HttpUrl]
-    
+    force_refresh: bool = False
+    max_age: Optional[int] = Field(None, ge=0)
+    stream: Optional[Literal["ndjson", "sse"]] = None
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -155,6 +206,74 @@ class BatchGradeRequest(BaseModel):
             }
         }
 
+class JobResponse(BaseModel):
+    job_id: str
+    url: str
+    status: str
+    queue_position: Optional[int] = None
+    created_at: Optional[str] = None
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    result: Optional[GradeResponse] = None
+    error: Optional[str] = None
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "job_id": "3f2b9c0e8d7a4b5c9e1f2a3b4c5d6e7f",
+                "url": "https://blog.naver.com/nyang2ne/224038751161",
+                "status": "queued",
+                "queue_position": 2,
+                "created_at": "2025-11-19 19:30:00",
+                "started_at": None,
+                "finished_at": None,
+                "result": None,
+                "error": None
+            }
+        }
+
+class HistoryEntry(BaseModel):
+    timestamp: str
+    grade: Optional[str] = None
+    level: Optional[str] = None
+    tier: Optional[str] = None
+    tier_rank: Optional[int] = None
+    success: bool
+    error: Optional[str] = None
+
+class BlogHistoryResponse(BaseModel):
+    blog_id: str
+    count: int
+    entries: List[HistoryEntry]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "blog_id": "nyang2ne",
+                "count": 2,
+                "entries": [
+                    {
+                        "timestamp": "2025-10-01 09:00:00",
+                        "grade": "최적1+",
+                        "level": "엑스퍼트2",
+                        "tier": "엑스퍼트 블로거",
+                        "tier_rank": 2,
+                        "success": True,
+                        "error": None
+                    },
+                    {
+                        "timestamp": "2025-11-19 19:30:45",
+                        "grade": "최적2+",
+                        "level": "엑스퍼트3",
+                        "tier": "엑스퍼트 블로거",
+                        "tier_rank": 3,
+                        "success": True,
+                        "error": None
+                    }
+                ]
+            }
+        }
+
 def validate_naver_blog_url(url: str) -> bool:
     """
     네이버 블로그 URL 여부 검증
@@ -196,7 +315,9 @@ async def health_check():
     return {
         "status": "ok",
         "message": "BlogDex Grade API is running",
-        "max_concurrent": MAX_CONCURRENT_CRAWLS
+        "max_concurrent": semaphore.limit,
+        "pool": driver_pool.stats(),
+        "executor": crawl_executor.stats()
     }
 
 # 단일 URL 조회
@@ -206,47 +327,89 @@ async def get_blog_grade(request: GradeRequest):
     단일 블로그 URL의 등급 조회
 
     - **url**: 블로그 URL (필수)
+    - **force_refresh**: true면 캐시를 무시하고 새로 크롤링
+    - **max_age**: 허용할 캐시 결과의 최대 경과 시간 (초)
 
-    크롤링 완료까지 30-40초 소요됩니다.
+    캐시된 결과가 있으면 즉시 반환하고,
+    없으면 크롤링 완료까지 30-40초 소요됩니다.
     최대 180초 타임아웃 적용.
     """
-    url = str(request.url)
+    result = await resolve_grade(str(request.url), request.force_refresh, request.max_age)
+    return GradeResponse(**result)
+
+async def resolve_grade(url: str, force_refresh: bool = False, max_age: Optional[int] = None) -> dict:
+    """
+    캐시 조회 → 진행 중인 크롤링 합류 → 새 크롤링 순서로 등급 결과 반환
+    (단일 조회 API와 작업 큐 워커가 공통으로 사용)
+
+    Raises:
+        HTTPException: 타임아웃(504) 또는 크롤링 실패(500)
+    """
+    blog_id = build_blog_id(url)
     start_time = time.time()
     logger.info(f"요청 시작: {url}")
 
-    # 중복 요청 체크
-    with crawling_lock:
-        if url in crawling_urls:
-            logger.warning(f"중복 요청 거부: {url}")
-            raise HTTPException(
-                status_code=409,
-                detail=f"이미 처리 중인 URL입니다: {url}"
-            )
-        crawling_urls.add(url)
+    # 캐시 조회 (force_refresh가 아닐 때만)
+    if not force_refresh:
+        cached = result_cache.get(blog_id, max_age=max_age)
+        if cached:
+            cached["url"] = url
+            cached["cached"] = True
+            logger.info(f"캐시 반환: {url} (blog_id={blog_id})")
+            return cached
+
+    # 같은 블로그에 대한 크롤링이 진행 중이면 그 결과를 함께 기다림
+    task = inflight_crawls.get(blog_id)
+    if task is not None:
+        logger.info(f"진행 중인 크롤링에 합류: {url} (blog_id={blog_id})")
+    else:
+        task = asyncio.ensure_future(_crawl_blog(url, blog_id))
+        inflight_crawls[blog_id] = task
+        task.add_done_callback(lambda t: _finish_inflight(blog_id, t))
+
+    # shield: 한 요청이 취소되어도 공유 크롤링은 계속 진행
+    result = dict(await asyncio.shield(task))
+    result["url"] = url
+
+    elapsed = time.time() - start_time
+    logger.info(f"요청 완료: {url} ({elapsed:.2f}초)")
+    return result
+
+async def _crawl_blog(url: str, blog_id: str) -> dict:
+    """
+    실제 크롤링 실행 (blog_id당 하나만 실행되며 결과는 모든 대기 요청이 공유)
 
+    Raises:
+        HTTPException: 타임아웃(504) 또는 크롤링 실패(500)
+    """
+    start_time = time.time()
+    # 응답 타임아웃과 같은 마감 시각 (HTTP 조회와 Chrome 폴백이 함께 사용, 180초 = 3분, 실행기 대기 시간 포함)
+    deadline = start_time + CRAWL_TIMEOUT
     try:
-        # 세마포어로 병렬 제한 (최대 3개)
-        async with semaphore:
-            # 블로킹 크롤링을 별도 스레드에서 실행
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor() as pool:
-                # 타임아웃 추가 (180초 = 3분)
-                # Phase 2: 드라이버 풀 사용
-                result = await asyncio.wait_for(
-                    loop.run_in_executor(pool, crawl_blog_grade_with_pool, url),
-                    timeout=180
-                )
+        if CRAWL_MODE == "http":
+            # HTTP 빠른 조회, 실패 시 Chrome으로 폴백
+            # (느린 API가 스레드를 무한정 붙잡지 않도록 같은 세마포어/실행기/마감 시각 사용)
+            result = await _run_crawl(crawl_blog_grade_http, url, deadline)
+            if result:
+                result_cache.set(blog_id, result)
+                return result
+            logger.info(f"HTTP 조회 실패 - Chrome 크롤링으로 폴백: {url}")
 
-        elapsed = time.time() - start_time
-        logger.info(f"요청 완료: {url} ({elapsed:.2f}초)")
-        return GradeResponse(**result)
+        # 블로킹 크롤링을 공용 실행기 스레드에서 실행 (드라이버 풀 또는 탭 공유)
+        result = await _run_crawl(crawl_function, url, deadline)
+
+        # 성공한 결과만 캐시에 저장
+        if result.get("success"):
+            result_cache.set(blog_id, result)
+
+        return result
 
     except asyncio.TimeoutError:
         elapsed = time.time() - start_time
         logger.error(f"타임아웃: {url} ({elapsed:.2f}초)")
         raise HTTPException(
             status_code=504,
-            detail=f"크롤링 타임아웃 (180초 초과): {url}"
+            detail=f"크롤링 타임아웃 ({CRAWL_TIMEOUT}초 초과): {url}"
         )
 
     except Exception as e:
@@ -256,10 +419,43 @@ async def get_blog_grade(request: GradeRequest):
             status_code=500,
             detail=f"크롤링 실패: {str(e)}"
         )
-    finally:
-        # 처리 완료 후 제거
-        with crawling_lock:
-            crawling_urls.discard(url)
+
+async def _run_crawl(fn, url: str, deadline: float):
+    """
+    세마포어로 병렬 제한 후 공용 실행기 스레드에서 fn(url, deadline) 실행
+
+    마감 시각을 작업에도 넘겨 타임아웃 후에는 작업 스레드도 스스로 중단
+
+    Raises:
+        asyncio.TimeoutError: 마감 시각까지 끝나지 않은 경우
+    """
+    # 드라이버 풀 크기 × 드라이버당 탭 수만큼
+    await semaphore.acquire()
+    try:
+        future = crawl_executor.run(fn, url, deadline)
+    except Exception:
+        semaphore.release()
+        raise
+    # 세마포어는 스레드가 실제로 끝날 때 해제
+    # (타임아웃 후에도 스레드가 드라이버를 쥐고 있는 동안 슬롯 유지)
+    future.add_done_callback(_release_crawl_slot)
+
+    return await asyncio.wait_for(asyncio.shield(future), timeout=max(0, deadline - time.time()))
+
+def _release_crawl_slot(future: asyncio.Future):
+    """크롤링 스레드 종료 시 세마포어 해제"""
+    semaphore.release()
+    # 타임아웃으로 아무도 기다리지 않는 경우에도 예외 미확인 경고가 나지 않도록 확인
+    if not future.cancelled():
+        future.exception()
+
+def _finish_inflight(blog_id: str, task: asyncio.Task):
+    """크롤링 완료 시 진행 중 목록에서 제거"""
+    if inflight_crawls.get(blog_id) is task:
+        del inflight_crawls[blog_id]
+    # 대기 요청이 모두 사라진 경우에도 예외 미확인 경고가 나지 않도록 확인
+    if not task.cancelled():
+        task.exception()
 
 # 다수 URL 일괄 조회
 @app.post("/api/blog/grades", response_model=List[GradeResponse])
@@ -268,15 +464,31 @@ async def get_blog_grades(request: BatchGradeRequest):
     다수 블로그 URL의 등급 일괄 조회
     
     - **urls**: 블로그 URL 리스트 (필수)
+    - **force_refresh** / **max_age**: 단일 조회와 동일하게 캐시 제어
+    
+    - **stream**: "ndjson" 또는 "sse" 지정 시 완료되는 순서대로 결과를 스트리밍
+      (각 결과에 입력 순서 `index` 포함)
     
-    최대 3개까지 동시 처리, 나머지는 대기합니다.
+    드라이버 풀 크기(기본 3개)만큼 동시 처리, 나머지는 대기합니다.
     5개 URL의 경우: 30-40초 (3개) + 30-40초 (2개) = 약 60-80초 소요
     """
+    if request.stream:
+        media_type = "text/event-stream" if request.stream == "sse" else "application/x-ndjson"
+        return StreamingResponse(
+            _stream_grades(request),
+            media_type=media_type,
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+
     tasks = []
     
     for url in request.urls:
         # 각 URL에 대해 get_blog_grade 호출
-        task = get_blog_grade(GradeRequest(url=url))
+        task = get_blog_grade(GradeRequest(
+            url=url,
+            force_refresh=request.force_refresh,
+            max_age=request.max_age
+        ))
         tasks.append(task)
     
     # 모든 작업 동시 실행 (세마포어로 제한)
@@ -297,18 +509,226 @@ async def get_blog_grades(request: BatchGradeRequest):
     
     return final_results
 
+async def _indexed_grade(index: int, url: str, request: BatchGradeRequest):
+    """스트리밍용: 입력 순서와 함께 결과 반환 (예외는 실패 응답으로 변환)"""
+    try:
+        result = await resolve_grade(url, request.force_refresh, request.max_age)
+        return index, GradeResponse(**result)
+    except Exception as e:
+        return index, GradeResponse(
+            url=url,
+            level=None,
+            success=False,
+            error=str(e)
+        )
+
+async def _stream_grades(request: BatchGradeRequest):
+    """
+    완료 순서대로 결과를 NDJSON/SSE 형식으로 생성
+    동시에 진행하는 작업 수를 STREAM_WINDOW로 제한하여 대량 요청에도 메모리 사용량 일정
+    """
+    urls = [str(url) for url in request.urls]
+    pending = set()
+    next_index = 0
+
+    try:
+        while next_index < len(urls) or pending:
+            while next_index < len(urls) and len(pending) < STREAM_WINDOW:
+                pending.add(asyncio.ensure_future(
+                    _indexed_grade(next_index, urls[next_index], request)
+                ))
+                next_index += 1
+
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index, response = task.result()
+                payload = json.dumps({"index": index, **response.model_dump()}, ensure_ascii=False)
+                if request.stream == "sse":
+                    yield f"event: grade\ndata: {payload}\n\n"
+                else:
+                    yield payload + "\n"
+
+        if request.stream == "sse":
+            yield f"event: done\ndata: {json.dumps({'count': len(urls)})}\n\n"
+    finally:
+        # 클라이언트 연결 종료 시 대기 중인 작업 정리 (공유 크롤링 자체는 계속 진행)
+        for task in pending:
+            task.cancel()
+
+# 비동기 작업 등록
+@app.post("/api/jobs", response_model=JobResponse, status_code=202)
+async def create_job(request: GradeRequest):
+    """
+    단일 URL 등급 조회 작업 등록 (즉시 반환)
+
+    - **url**: 블로그 URL (필수)
+    - **force_refresh** / **max_age**: 단일 조회와 동일하게 캐시 제어
+
+    반환된 job_id로 `GET /api/jobs/{job_id}`를 호출해 결과를 확인합니다.
+    """
+    try:
+        job = job_manager.submit(str(request.url), request.force_refresh, request.max_age)
+    except QueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    logger.info(f"작업 등록: {job.job_id} ({job.url})")
+    return JobResponse(**job_manager.to_dict(job))
+
+# 다수 URL 비동기 작업 등록
+@app.post("/api/jobs/batch", response_model=List[JobResponse], status_code=202)
+async def create_jobs(request: BatchGradeRequest):
+    """
+    다수 URL 등급 조회 작업 일괄 등록 (즉시 반환)
+
+    - **urls**: 블로그 URL 리스트 (필수)
+
+    큐에 남은 자리가 부족하면 하나도 등록하지 않고 503을 반환합니다.
+    """
+    if job_manager.free_slots() < len(request.urls):
+        raise HTTPException(
+            status_code=503,
+            detail=f"작업 큐 여유 공간 부족 (요청: {len(request.urls)}개, 여유: {job_manager.free_slots()}개)"
+        )
+
+    jobs = [
+        job_manager.submit(str(url), request.force_refresh, request.max_age)
+        for url in request.urls
+    ]
+    logger.info(f"작업 일괄 등록: {len(jobs)}개")
+    return [JobResponse(**job_manager.to_dict(job)) for job in jobs]
+
+# 작업 상태 조회
+@app.get("/api/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    """
+    작업 상태 및 결과 조회
+
+    - **status**: queued / running / done / failed
+    - **queue_position**: 대기 순서 (queued 상태일 때만, 1 = 다음 차례)
+    - **result**: 완료 시 등급 결과
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+    return JobResponse(**job_manager.to_dict(job))
+
+def _normalize_time(value: Optional[str], name: str) -> Optional[str]:
+    """조회 구간 파라미터를 저장 형식('YYYY-MM-DD HH:MM:SS' 또는 'YYYY-MM-DD')으로 정규화"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", ""))
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{name} 형식 오류 (YYYY-MM-DD 또는 YYYY-MM-DD HH:MM:SS): {value}"
+        )
+    if len(value) <= 10:
+        return parsed.strftime('%Y-%m-%d')
+    return parsed.strftime('%Y-%m-%d %H:%M:%S')
+
+# 블로그 등급 이력 조회
+@app.get("/api/blog/{blog_id}/history", response_model=BlogHistoryResponse)
+async def get_blog_history(
+    blog_id: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    limit: int = Query(1000, ge=1, le=10000),
+    success_only: bool = True,
+    changes_only: bool = False
+):
+    """
+    저장된 결과로 블로그 등급 이력 조회 (재크롤링 없음, 시간 오름차순)
+
+    - **start / end**: 조회 구간 (YYYY-MM-DD 또는 YYYY-MM-DD HH:MM:SS, end 포함)
+    - **limit**: 최근 N건 (기본 1000)
+    - **success_only**: 성공한 조회만 (기본 true)
+    - **changes_only**: 등급이 바뀐 시점만 (등급 추이 확인용)
+    """
+    start = _normalize_time(start, "start")
+    end = _normalize_time(end, "end")
+
+    loop = asyncio.get_event_loop()
+    rows = await loop.run_in_executor(
+        None, lambda: result_db.history(blog_id, start, end, success_only=success_only, limit=limit)
+    )
+
+    if changes_only:
+        changes, previous = [], object()
+        for row in rows:
+            if row["grade"] != previous:
+                changes.append(row)
+                previous = row["grade"]
+        rows = changes
+
+    entries = [HistoryEntry(**{key: row[key] for key in HistoryEntry.model_fields}) for row in rows]
+    return BlogHistoryResponse(blog_id=blog_id, count=len(entries), entries=entries)
+
+# 블로그 최근 등급 조회 (저장된 결과)
+@app.get("/api/blog/{blog_id}/latest", response_model=GradeResponse)
+async def get_blog_latest(blog_id: str):
+    """
+    저장된 결과 중 가장 최근에 성공한 조회 결과 (재크롤링 없음)
+    """
+    loop = asyncio.get_event_loop()
+    row = await loop.run_in_executor(None, result_db.latest, blog_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail=f"저장된 결과가 없습니다: {blog_id}")
+    return row
+
+# 저장된 결과 내보내기 (분석용)
+@app.get("/api/export")
+async def export_results(
+    format: Literal["csv", "parquet", "arrow"] = "csv",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    tier: Optional[str] = None,
+    success: Optional[bool] = None
+):
+    """
+    저장된 결과를 파일로 스트리밍 (재크롤링 없음)
+
+    - **format**: csv, parquet, arrow (Arrow IPC 스트림) - parquet/arrow는 pyarrow 필요
+    - **start / end**: 조회 구간 (YYYY-MM-DD 또는 YYYY-MM-DD HH:MM:SS, end 포함)
+    - **tier**: 티어 (한글 또는 영문, 예: Elite Blogger)
+    - **success**: true면 성공만, false면 실패만 (생략 시 전체)
+
+    결과를 묶음 단위로 읽어 바로 전송하므로 행 수와 관계없이 서버 메모리 사용량 일정
+    """
+    start = _normalize_time(start, "start")
+    end = _normalize_time(end, "end")
+    try:
+        chunks = iter_export(format, start=start, end=end, tier=tier, success=success)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    media_type, extension = EXPORT_FORMATS[format]
+    filename = f"blogdex_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+    # 동기 제너레이터는 스레드 풀에서 순회되므로 SQLite 조회가 이벤트 루프를 막지 않음
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 # 현재 처리 중인 URL 조회 (디버깅용)
 @app.get("/api/status")
 async def get_status():
     """
-    현재 처리 중인 URL 목록 조회
+    현재 처리 중인 블로그 목록 조회
     """
-    with crawling_lock:
-        return {
-            "processing_urls": list(crawling_urls),
-            "count": len(crawling_urls),
-            "max_concurrent": MAX_CONCURRENT_CRAWLS
-        }
+    return {
+        "processing_blog_ids": list(inflight_crawls.keys()),
+        "count": len(inflight_crawls),
+        "max_concurrent": semaphore.limit,
+        "pool": driver_pool.stats(),
+        "executor": crawl_executor.stats(),
+        "tabs": tab_pool.stats(),
+        "session": session_manager.stats(),
+        "writer": result_writer.stats(),
+        "cache": result_cache.stats(),
+        "jobs": job_manager.stats()
+    }
 
 if __name__ == "__main__":
     import uvicorn
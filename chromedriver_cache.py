@@ -0,0 +1,150 @@
+"""
+패치된 chromedriver 실행 파일 캐시
+설치된 Chrome 주 버전을 감지하여 버전별로 한 번만 다운로드/패치하고,
+모든 uc.Chrome 인스턴스가 같은 실행 파일을 공유하도록 경로를 제공
+"""
+
+from pathlib import Path
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import logging
+from typing import Optional
+
+from undetected_chromedriver.patcher import Patcher
+
+logger = logging.getLogger(__name__)
+
+# 버전 감지 실패 시 사용할 Chrome 주 버전 (이전 고정값)
+DEFAULT_CHROME_VERSION = 141
+
+CHROME_BINARIES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+]
+
+
+def detect_chrome_major_version() -> Optional[int]:
+    """
+    설치된 Chrome 주 버전 감지
+
+    Returns:
+        주 버전 (예: 141) 또는 None
+    """
+    if sys.platform.startswith("win"):
+        try:
+            import winreg
+            for root in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+                try:
+                    with winreg.OpenKey(root, r"Software\Google\Chrome\BLBeacon") as key:
+                        version, _ = winreg.QueryValueEx(key, "version")
+                        return int(version.split(".")[0])
+                except OSError:
+                    continue
+        except ImportError:
+            pass
+        return None
+
+    for binary in CHROME_BINARIES:
+        try:
+            output = subprocess.run(
+                [binary, "--version"], capture_output=True, text=True, timeout=10
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r"(\d+)\.\d+\.\d+", output)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+class ChromeDriverCache:
+    """Chrome 버전별 패치된 chromedriver 관리 클래스"""
+
+    def __init__(self, cache_dir=None, version_main=None):
+        """
+        Args:
+            cache_dir: 패치된 실행 파일 보관 디렉터리 (기본: undetected_chromedriver 데이터 경로/cache)
+            version_main: Chrome 주 버전 (None이면 설치된 Chrome에서 감지)
+        """
+        self.cache_dir = Path(cache_dir or os.path.join(Patcher.data_path, "cache"))
+        self._version_main = version_main
+        # 다운로드/패치는 프로세스 안에서 한 번만 (동시 실행 시 같은 파일을 덮어써 충돌)
+        self.lock = threading.Lock()
+        self._paths = {}
+
+    @property
+    def version_main(self) -> int:
+        if self._version_main is None:
+            detected = detect_chrome_major_version()
+            if detected:
+                logger.info(f"Chrome 버전 감지: {detected}")
+                self._version_main = detected
+            else:
+                logger.warning(f"⚠️ Chrome 버전 감지 실패 - 기본값 {DEFAULT_CHROME_VERSION} 사용")
+                self._version_main = DEFAULT_CHROME_VERSION
+        return self._version_main
+
+    def _cached_path(self, version_main: int) -> Path:
+        suffix = ".exe" if sys.platform.startswith("win") else ""
+        return self.cache_dir / f"chromedriver_{version_main}{suffix}"
+
+    def get_driver_path(self) -> Optional[str]:
+        """
+        현재 Chrome 버전에 맞는 패치된 chromedriver 경로
+        (캐시에 없으면 다운로드/패치 후 캐시에 저장)
+
+        Returns:
+            실행 파일 경로 또는 None (준비 실패 시 uc 기본 동작으로 폴백)
+        """
+        version_main = self.version_main
+        if version_main in self._paths:
+            return self._paths[version_main]
+
+        with self.lock:
+            if version_main in self._paths:
+                return self._paths[version_main]
+
+            target = self._cached_path(version_main)
+            try:
+                if not (target.exists() and Patcher(executable_path=str(target)).is_binary_patched()):
+                    self._patch_into(version_main, target)
+            except Exception as e:
+                logger.error(f"❌ chromedriver 캐시 준비 실패: {e}")
+                return None
+
+            self._paths[version_main] = str(target)
+            return self._paths[version_main]
+
+    def _patch_into(self, version_main: int, target: Path):
+        """다운로드/패치한 chromedriver를 임시 파일 → 교체 방식으로 캐시에 저장"""
+        logger.info(f"chromedriver {version_main} 다운로드 및 패치 중...")
+        patcher = Patcher(version_main=version_main)
+        patcher.auto()
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        shutil.copy2(patcher.executable_path, tmp)
+        os.chmod(tmp, 0o755)
+        # 다른 프로세스가 같은 파일을 쓰고 있어도 원자적으로 교체
+        os.replace(tmp, target)
+
+        try:
+            os.unlink(patcher.executable_path)
+        except OSError:
+            pass
+        logger.info(f"✅ chromedriver {version_main} 캐시 저장: {target}")
+
+
+# 글로벌 chromedriver 캐시 인스턴스
+_version_env = os.getenv("CHROME_VERSION_MAIN")
+chromedriver_cache = ChromeDriverCache(
+    cache_dir=os.getenv("CHROMEDRIVER_CACHE_DIR"),
+    version_main=int(_version_env) if _version_env else None
+)
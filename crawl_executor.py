@@ -0,0 +1,134 @@
+"""
+크롤링 전용 스레드 풀
+서버 수명 동안 하나의 실행기를 유지하고 대기/실행 중 작업 수를 집계
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import threading
+import logging
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlExecutor:
+    """드라이버 풀 크기에 맞춘 장수명 크롤링 실행기"""
+
+    def __init__(self):
+        self.executor = None
+        self.max_workers = 0
+        self.lock = threading.Lock()
+        self.queued = 0   # 제출되었지만 아직 스레드를 받지 못한 작업 수
+        self.active = 0   # 현재 스레드에서 실행 중인 작업 수
+
+    def start(self, max_workers: int):
+        """
+        실행기 시작 (서버 시작 시 1회)
+
+        Args:
+            max_workers: 작업 스레드 수 (드라이버 풀 크기와 동일하게 사용)
+        """
+        if self.executor is not None:
+            return
+        self.max_workers = max(1, max_workers)
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="crawl"
+        )
+        logger.info(f"크롤링 실행기 시작 (스레드: {self.max_workers}개)")
+
+    def shutdown(self, wait=False):
+        """실행기 종료 (대기 중인 작업은 취소)"""
+        if self.executor is None:
+            return
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+        self.executor = None
+        logger.info("크롤링 실행기 종료")
+
+    def run(self, fn, *args) -> asyncio.Future:
+        """
+        블로킹 함수를 실행기에서 실행하고 asyncio Future 반환
+
+        Raises:
+            RuntimeError: 실행기가 시작되지 않은 경우
+        """
+        if self.executor is None:
+            raise RuntimeError("크롤링 실행기가 시작되지 않았습니다")
+
+        with self.lock:
+            self.queued += 1
+        try:
+            future = self.executor.submit(self._track, fn, *args)
+        except Exception:
+            with self.lock:
+                self.queued -= 1
+            raise
+        return asyncio.wrap_future(future)
+
+    def _track(self, fn, *args):
+        with self.lock:
+            self.queued -= 1
+            self.active += 1
+        try:
+            return fn(*args)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def stats(self) -> Dict:
+        """실행기 상태 (상태 조회용)"""
+        with self.lock:
+            return {
+                "max_workers": self.max_workers,
+                "active": self.active,
+                "queued": self.queued
+            }
+
+
+class AdaptiveLimiter:
+    """
+    동시 실행 상한이 실시간으로 바뀌는 asyncio 세마포어
+    (상한은 limit_fn()으로 매번 조회 - 드라이버 풀 크기를 따라감)
+    """
+
+    def __init__(self, limit_fn, recheck_interval=1.0):
+        """
+        Args:
+            limit_fn: 현재 동시 실행 상한을 반환하는 함수
+            recheck_interval: 대기 중 상한 재확인 주기 (초, 풀 증설 반영용)
+        """
+        self.limit_fn = limit_fn
+        self.recheck_interval = recheck_interval
+        self.active = 0
+        self.waiting = 0
+        self._released = None
+
+    @property
+    def limit(self) -> int:
+        return max(1, self.limit_fn())
+
+    async def acquire(self):
+        if self._released is None:
+            self._released = asyncio.Event()
+
+        self.waiting += 1
+        try:
+            while self.active >= self.limit:
+                self._released.clear()
+                try:
+                    await asyncio.wait_for(self._released.wait(), timeout=self.recheck_interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.waiting -= 1
+        self.active += 1
+
+    def release(self):
+        self.active -= 1
+        if self._released is not None:
+            self._released.set()
+
+
+# 글로벌 크롤링 실행기 인스턴스
+crawl_executor = CrawlExecutor()
@@ -17,16 +17,25 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, JavascriptException
 from selenium.webdriver.common.action_chains import ActionChains
 import time
 import os
+import json
+import re
 from pathlib import Path
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 import pickle
 
+# 버전별로 한 번만 패치한 chromedriver 공유
+from chromedriver_cache import chromedriver_cache
+
+# 드라이버 대여 기한 초과 (크롤링 단계 사이에서 확인)
+from driver_pool import LeaseExpired
+
 # result_store 모듈 import (등급 매핑 및 저장 기능)
-from result_store import persist_result, enrich_result, get_level_info, GRADE_MAPPING
+from result_store import persist_result_async, enrich_result, get_level_info, find_grade_in_payload, build_blog_id, url_refers_to_blog, GRADE_FIELDS, GRADE_MAPPING
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -34,19 +43,118 @@ logger = logging.getLogger(__name__)
 # 환경변수 로드
 load_dotenv()
 
-def create_undetected_driver():
-    """undetected-chromedriver로 Chrome 드라이버 생성"""
+# 등급 수집 방식
+# - "dom": 검색 결과 페이지의 SVG text에서 추출 (기본)
+# - "network": CDP 네트워크 응답(JSON)에서 바로 추출, 실패 시 dom 방식으로 폴백
+GRADE_CAPTURE_MODE = os.getenv("GRADE_CAPTURE_MODE", "dom").lower()
+NETWORK_CAPTURE_TIMEOUT = float(os.getenv("NETWORK_CAPTURE_TIMEOUT", 15))
+
+# 크롤링 방식
+# - "browser": 항상 Chrome 드라이버 사용 (기본)
+# - "http": 세션 쿠키로 등급 API를 직접 호출, 실패(Cloudflare/세션 만료) 시 Chrome으로 폴백
+CRAWL_MODE = os.getenv("CRAWL_MODE", "browser").lower()
+
+# 결과 페이지 직접 이동 (검색 폼 입력 생략)
+# BLOGDEX_RESULT_URL 예: https://blogdex.space/blog/{blog_id}
+# 설정하지 않으면 검색 폼으로 처음 성공했을 때 도착한 결과 페이지 경로를 학습해서 사용
+DIRECT_NAVIGATION = os.getenv("DIRECT_NAVIGATION", "true").lower() == "true"
+DIRECT_NAVIGATION_TIMEOUT = float(os.getenv("DIRECT_NAVIGATION_TIMEOUT", 15))
+RESULT_URL_TEMPLATE = os.getenv("BLOGDEX_RESULT_URL", "")
+_learned_result_template = None
+
+# Chrome 실행 옵션
+# - HEADLESS: "true"이면 new headless 모드로 실행 (창 없음)
+# - CHROME_WINDOW_SIZE: 창 크기 "가로,세로" (headless 기본 1280,900 / 일반 모드는 미설정 시 최대화)
+HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
+CHROME_WINDOW_SIZE = os.getenv("CHROME_WINDOW_SIZE", "1280,900" if HEADLESS else "")
+
+# 리소스 차단 프로필 (등급 위젯에 필요한 스크립트/XHR은 유지)
+# - "off": 차단 안 함
+# - "analytics": 광고/분석 스크립트만 차단
+# - "standard": 분석 + 이미지/미디어/웹폰트 차단 (기본)
+# CHROME_BLOCK_URLS로 쉼표 구분 패턴을 추가 지정 가능 (예: *.css,*/ads/*)
+CHROME_BLOCK_PROFILE = os.getenv("CHROME_BLOCK_PROFILE", "standard").lower()
+ANALYTICS_BLOCK_PATTERNS = [
+    "*googletagmanager.com*", "*google-analytics.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*connect.facebook.net*", "*clarity.ms*",
+    "*hotjar.com*", "*mixpanel.com*", "*amplitude.com*", "*sentry.io*"
+]
+# 등급은 인라인 SVG text로 표시되므로 .svg 파일은 차단하지 않음
+MEDIA_BLOCK_PATTERNS = [
+    "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.ico*", "*.bmp*",
+    "*.mp4*", "*.webm*", "*.mp3*", "*.m4a*", "*.ogg*",
+    "*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"
+]
+
+def get_blocked_url_patterns():
+    """현재 차단 프로필의 URL 패턴 목록"""
+    patterns = []
+    if CHROME_BLOCK_PROFILE in ("analytics", "standard"):
+        patterns += ANALYTICS_BLOCK_PATTERNS
+    if CHROME_BLOCK_PROFILE == "standard":
+        patterns += MEDIA_BLOCK_PATTERNS
+    patterns += [p.strip() for p in os.getenv("CHROME_BLOCK_URLS", "").split(",") if p.strip()]
+    return patterns
+
+def apply_resource_blocking(driver):
+    """
+    현재 탭에 CDP Network.setBlockedURLs 적용
+    (CDP 설정은 탭 단위이므로 새 탭을 열 때마다 다시 호출)
+    """
+    patterns = get_blocked_url_patterns()
+    if not patterns:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    except Exception as e:
+        logger.warning(f"⚠️ 리소스 차단 적용 실패: {str(e)[:60]}")
+
+def create_undetected_driver(user_data_dir=None):
+    """
+    undetected-chromedriver로 Chrome 드라이버 생성
+
+    Args:
+        user_data_dir: 유지할 Chrome 프로필 디렉터리 (None이면 임시 프로필, 종료 시 삭제)
+    """
     try:
         options = uc.ChromeOptions()
-        options.add_argument('--start-maximized')
+        if HEADLESS:
+            options.add_argument('--headless=new')
+        if CHROME_WINDOW_SIZE:
+            options.add_argument(f'--window-size={CHROME_WINDOW_SIZE}')
+        else:
+            options.add_argument('--start-maximized')
         options.add_argument('--disable-blink-features=AutomationControlled')
 
-        # Chrome 141 버전에 맞는 드라이버 사용
-        driver = uc.Chrome(
+        if CHROME_BLOCK_PROFILE == "standard":
+            # CDP 적용 전 첫 페이지 로딩에서도 이미지를 받지 않도록 프로필 설정도 함께 사용
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2
+            })
+            options.add_argument('--autoplay-policy=user-gesture-required')
+
+        if GRADE_CAPTURE_MODE == "network":
+            # CDP 네트워크 이벤트를 performance 로그로 수집
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+        # 설치된 Chrome 버전에 맞춰 캐시에 패치해 둔 드라이버 사용 (uc는 패치된 파일이면 건너뜀)
+        driver_path = chromedriver_cache.get_driver_path()
+        chrome_kwargs = dict(
             options=options,
+            user_data_dir=user_data_dir,
+            driver_executable_path=driver_path,
             use_subprocess=False,
-            version_main=141  # Chrome 버전 명시
+            version_main=chromedriver_cache.version_main
         )
+        if driver_path:
+            driver = uc.Chrome(**chrome_kwargs)
+        else:
+            # 캐시 준비 실패 시 uc가 매번 패치하므로 동시 생성 충돌 방지를 위해 직렬화
+            with chromedriver_cache.lock:
+                driver = uc.Chrome(**chrome_kwargs)
+
+        apply_resource_blocking(driver)
 
         return driver
     except Exception as e:
@@ -54,11 +162,13 @@ def create_undetected_driver():
         return None
 
 def save_cookies(driver, filepath="cookies.pkl"):
-    """로그인 후 쿠키를 파일로 저장"""
+    """로그인 후 쿠키를 파일로 저장 (임시 파일에 쓴 뒤 교체하여 읽는 쪽이 깨진 파일을 보지 않음)"""
     try:
         cookies = driver.get_cookies()
-        with open(filepath, 'wb') as f:
+        tmp_path = f"{filepath}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
             pickle.dump(cookies, f)
+        os.replace(tmp_path, filepath)
         return True
     except Exception as e:
         print(f"[ERROR] 쿠키 저장 실패: {e}")
@@ -71,7 +181,10 @@ def load_cookies(driver, filepath="cookies.pkl"):
     
     try:
         driver.get("https://blogdex.space/")
-        time.sleep(1)
+        # 고정 대기 대신 문서 로딩 완료까지만 대기
+        WebDriverWait(driver, 10).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
         
         with open(filepath, 'rb') as f:
             cookies = pickle.load(f)
@@ -113,6 +226,20 @@ def verify_login_status(driver):
         print(f"[ERROR] 로그인 상태 확인 실패: {e}")
         return False
 
+def session_cookie_expiry(cookies):
+    """
+    로그인 쿠키(user-token / session-token) 중 가장 이른 만료 시각
+
+    Returns:
+        만료 시각(epoch 초), 만료 시각 없는 세션 쿠키만 있으면 float('inf'), 로그인 쿠키가 없으면 None
+    """
+    expiries = [
+        c.get('expiry', float('inf'))
+        for c in cookies
+        if 'user-token' in c.get('name', '') or 'session-token' in c.get('name', '')
+    ]
+    return min(expiries) if expiries else None
+
 def retry_with_backoff(func, max_retries=3, backoff_factor=2, exceptions=(Exception,)):
     """
     재시도 로직 with exponential backoff
@@ -134,6 +261,9 @@ def retry_with_backoff(func, max_retries=3, backoff_factor=2, exceptions=(Except
     for attempt in range(max_retries):
         try:
             return func()
+        except LeaseExpired:
+            # 기한이 지난 작업은 재시도하지 않음
+            raise
         except exceptions as e:
             if attempt == max_retries - 1:
                 # 마지막 시도 실패
@@ -233,180 +363,561 @@ def login_google(driver):
         print(f"[ERROR] 구글 로그인 실패: {e}")
         return False
 
-def extract_blog_grade(driver, blog_url):
-    """블로그 URL의 등급을 추출"""
+def perform_login(driver, filepath="cookies.pkl"):
+    """
+    BlogDex 메인 페이지에서 구글 OAuth 로그인 전체 과정 수행 후 쿠키 저장
+
+    Args:
+        driver: BlogDex에 접속한 드라이버
+        filepath: 로그인 성공 시 쿠키를 저장할 파일
+
+    Returns:
+        로그인 성공 여부
+    """
+    # 팝업 닫기
     try:
-        logger.info(f"🚀 extract_blog_grade 시작: {blog_url}")
+        driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
+        time.sleep(3)
+    except:
+        pass
 
-        # 🔥 중요: 명시적으로 BlogDex 홈페이지로 이동 (드라이버 풀에서 받은 드라이버는 다른 페이지에 있을 수 있음)
-        if "blogdex.space" not in driver.current_url or "/blog/" in driver.current_url:
-            logger.info(f"📍 현재 URL: {driver.current_url} → BlogDex 홈으로 이동")
-            driver.get("https://blogdex.space/")
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            # 조건부 대기: body 요소가 완전히 로드될 때까지
-            WebDriverWait(driver, 5).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
-            )
-            logger.info("✅ BlogDex 홈페이지 로딩 완료")
+    # 로그인 버튼들 클릭
+    try:
+        first_button_selector = "#radix-\\:R7336\\:"
+        first_button = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, first_button_selector))
+        )
+        first_button.click()
+        time.sleep(3)
+
+        login_button_selector = "#radix-\\:R7336H1\\: > div:nth-child(5) > span"
+        login_button = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, login_button_selector))
+        )
+        login_button.click()
+        time.sleep(3)
+
+        terms_button = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, "#terms"))
+        )
+        terms_button.click()
+        time.sleep(3)
+    except:
+        pass
+
+    # 구글 로그인
+    google_selectors = [
+        "button:has(svg[data-icon='google'])",
+        "button.bg-primary:has(svg)",
+        "#__next > div > main > div > div > div.grid.gap-2 > button:nth-child(1)"
+    ]
+
+    # 구글 버튼 클릭 재시도
+    google_click_success = retry_with_backoff(
+        lambda: click_with_retry(driver, google_selectors, max_retries=1, wait_time=7),
+        max_retries=3,
+        backoff_factor=2
+    )
+    if not google_click_success:
+        print("[ERROR] 구글 로그인 버튼을 찾지 못했습니다")
+        return False
+
+    time.sleep(7)
+    print("[INFO] 구글 로그인 페이지 이동 완료")
 
-        # 마우스 스크롤 (최소화)
-        actions = ActionChains(driver)
-        actions.move_by_offset(0, 10).perform()
-        time.sleep(0.3)  # 1초 → 0.3초로 단축
+    # 로그인도 재시도 (최대 2회)
+    login_success = retry_with_backoff(
+        lambda: login_google(driver),
+        max_retries=2,
+        backoff_factor=3
+    )
+    if not login_success:
+        return False
+
+    save_cookies(driver, filepath)
+    return True
+
+# 🔥 SVG text 셀렉터 최적화 (속성 기반, 우선순위 순)
+# 사용자 제공 정보: font-family="Pretendard", font-size="22px", font-weight="700", fill="#e27d13"
+# SVG text 요소: <text font-family="Pretendard" font-size="22px" font-weight="700" fill="#e27d13" x="-30" y="-60">최적1+</text>
+GRADE_SELECTORS = [
+    # 가장 정확한 셀렉터 (사용자 제공 정보 기반 - 모든 속성 매칭)
+    "svg text[font-family='Pretendard'][font-size='22px'][font-weight='700'][fill='#e27d13']",
+    "svg text[font-family='Pretendard'][font-size='22px'][font-weight='700']",
+    "svg text[font-size='22px'][font-weight='700']",
+    "svg text[fill='#e27d13'][font-size='22px']",
+    "svg text[font-family='Pretendard'][font-size='22px']",
+    # 속성 기반 셀렉터 (가장 안정적 - Pretendard 폰트 사용)
+    "svg text[font-family='Pretendard']",
+    "svg text[font-weight='700']",
+    "svg text[font-size='22px']",
+    # fill 색상 기반 (주황색 #e27d13)
+    "svg text[fill='#e27d13']",
+    "svg text[fill*='e27d13']",
+    # nth-child 기반 (기존 방식)
+    "svg > text:nth-child(2)",
+    "div[class*='justify-center'] svg > text:nth-child(2)",
+    # 원래 셀렉터 (백업)
+    "#__next > div > main > div > div.flex.flex-col.gap-4 > div:nth-child(1) > div.p-6.pt-0 > div.flex.flex-col.justify-center.space-y-12.py-5.md\\:flex-row.md\\:justify-between.md\\:space-x-0.md\\:space-y-0.md\\:py-0 > div.flex.flex-1.justify-center.px-5 > div > svg > text:nth-child(2)",
+    # 넓은 범위 (마지막 백업)
+    "#__next svg > text:nth-child(2)"
+]
+
+# 정규식 폴백 (blogdex_selenium_login.py의 search_blog와 동일한 패턴)
+GRADE_TEXT_PATTERN = r'(준?최[적상하]?\d\+?)'
+
+# 모든 등급 셀렉터를 우선순위대로 검사하여 보이는 요소 중 알려진 등급 텍스트를 찾는 함수
+_GRADE_PROBE_JS = """
+const probeGrade = (selectors, grades) => {
+    for (const selector of selectors) {
+        let elements;
+        try {
+            elements = document.querySelectorAll(selector);
+        } catch (e) {
+            continue;
+        }
+        for (const el of elements) {
+            const text = (el.textContent || '').trim();
+            if (grades.has(text) && el.getClientRects().length > 0) {
+                return {grade: text, selector: selector};
+            }
+        }
+    }
+    return null;
+};
+"""
+
+# 즉시 1회 검사 (탭 폴링용)
+# arguments: [셀렉터 목록, 알려진 등급 목록]
+# 반환: {grade, selector} 또는 null
+PROBE_GRADE_SCRIPT = _GRADE_PROBE_JS + """
+return probeGrade(arguments[0], new Set(arguments[1]));
+"""
 
-        # 🔥 사용자 요청: URL 입력 전 강제 새로고침
-        logger.info("🔄 페이지 강제 새로고침 중...")
-        driver.refresh()
-        # 조건부 대기: 새로고침 후 입력 필드가 준비될 때까지 대기
+# 즉시 검사 후 없으면 DOM 변경을 감시하며 대기
+# arguments: [셀렉터 목록, 알려진 등급 목록, 타임아웃(ms), callback]
+# 반환: {grade, selector} 또는 null (타임아웃)
+WAIT_FOR_GRADE_SCRIPT = _GRADE_PROBE_JS + """
+const selectors = arguments[0];
+const grades = new Set(arguments[1]);
+const timeoutMs = arguments[2];
+const done = arguments[arguments.length - 1];
+const probe = () => probeGrade(selectors, grades);
+const found = probe();
+if (found) {
+    done(found);
+    return;
+}
+let timer = null;
+const observer = new MutationObserver(() => {
+    const hit = probe();
+    if (hit) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(hit);
+    }
+});
+observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+timer = setTimeout(() => {
+    observer.disconnect();
+    done(null);
+}, timeoutMs);
+"""
+
+def wait_for_grade(driver, timeout=40):
+    """
+    등급 셀렉터 전체를 페이지 안에서 한 번에 검사하며, 등급이 렌더링되는 즉시 반환
+    (셀렉터별 WebDriverWait 반복 및 고정 대기 대신 사용)
+
+    Args:
+        driver: Chrome 드라이버
+        timeout: 최대 대기 시간 (초)
+
+    Returns:
+        {"grade": 등급, "selector": 일치한 셀렉터} 또는 None (타임아웃)
+    """
+    deadline = time.time() + timeout
+    grades = list(GRADE_MAPPING.keys())
+
+    while True:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return None
         try:
-            WebDriverWait(driver, 5).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "#__next > div > main > div > div.flex.w-full.space-x-2 > div > input"))
+            driver.set_script_timeout(remaining + 5)
+            return driver.execute_async_script(
+                WAIT_FOR_GRADE_SCRIPT, GRADE_SELECTORS, grades, int(remaining * 1000)
             )
-            logger.info("✅ 새로고침 완료 (입력 필드 준비됨)")
-        except:
-            # 입력 필드를 찾지 못하면 고정 대기
-            time.sleep(2)
-            logger.info("✅ 새로고침 완료 (고정 대기)")
-
-        # 🔥 Phase 5: 사용자 제공 정확한 셀렉터 사용
-        # 사용자 제공 셀렉터: #__next > div > main > div > div.flex.w-full.space-x-2 > div > input
-        url_input_selectors = [
-            # 사용자 제공 정확한 셀렉터 (최우선)
-            "#__next > div > main > div > div.flex.w-full.space-x-2 > div > input",
-            # 약간 변형된 셀렉터 (백업)
-            "#__next div.flex.w-full.space-x-2 input",
-            "div.flex.w-full.space-x-2 input",
-            # 클래스 기반
-            "input.h-14[placeholder='블로그 주소/아이디를 입력하세요.']",
-            "input.w-\\[310px\\][placeholder='블로그 주소/아이디를 입력하세요.']",
-            # placeholder 기반 (백업)
-            "input[placeholder='블로그 주소/아이디를 입력하세요.']",
-            # 구조 기반 백업
-            "main section input[type='text']",
-            "main input[placeholder]"
-        ]
-
-        url_input = None
-        for selector in url_input_selectors:
+        except (JavascriptException, TimeoutException) as e:
+            # 검색 후 페이지 이동으로 스크립트가 중단된 경우 새 문서에서 다시 대기
+            # (세션 종료/창 닫힘 등 다른 WebDriverException은 재시도하지 않고 그대로 전달)
+            logger.debug(f"등급 대기 스크립트 재시도: {str(e)[:60]}")
+            time.sleep(0.2)
+
+def scan_grade_text(driver):
+    """페이지 전체 텍스트에서 정규식으로 등급 탐색 (셀렉터 실패 시 폴백)"""
+    page_text = driver.execute_script("return document.body ? document.body.innerText : '';") or ""
+    matches = re.findall(GRADE_TEXT_PATTERN, page_text)
+    return matches[0] if matches else None
+
+def drain_performance_log(driver):
+    """지금까지 쌓인 performance 로그 비우기 (검색 직전 호출)"""
+    try:
+        driver.get_log("performance")
+    except Exception as e:
+        logger.debug(f"performance 로그 비우기 실패: {str(e)[:60]}")
+
+# RSC(x-component) 응답에서 등급 필드 탐색용 ("grade":"준최5" 형태)
+RSC_GRADE_PATTERN = re.compile(r'"(?:%s)"\s*:\s*"([^"]+)"' % "|".join(GRADE_FIELDS))
+
+def _parse_grade_body(body, blog_id, scoped=False):
+    """
+    응답 본문에서 요청한 블로그의 등급과 원본 데이터 추출
+    (JSON이면 등급 필드, 아니면 RSC 본문에서 blog_id 뒤에 나오는 등급 필드)
+
+    Args:
+        body: 응답 본문
+        blog_id: 요청한 블로그 ID
+        scoped: 응답 URL이 이 블로그를 가리키는지 여부
+    """
+    try:
+        payload = json.loads(body)
+    except (TypeError, ValueError):
+        body = body or ""
+        if scoped:
+            start = 0
+        else:
+            # URL에 blog_id가 없으면 본문에서 blog_id가 나온 위치 이후만 탐색
+            start = body.find(f'"{blog_id}"')
+            if start < 0:
+                return None, None
+        for match in RSC_GRADE_PATTERN.finditer(body, start):
+            if match.group(1) in GRADE_MAPPING:
+                return match.group(1), None
+        return None, None
+    return find_grade_in_payload(payload, blog_id, scoped=scoped), payload
+
+def capture_grade_from_network(driver, blog_id, timeout=15):
+    """
+    CDP 네트워크 이벤트(performance 로그)에서 BlogDex API 응답을 찾아 등급 추출
+    React 렌더링을 기다리지 않고 응답이 도착하는 즉시 반환
+    (응답 URL 또는 본문이 요청한 블로그를 가리키는 경우만 사용)
+
+    Args:
+        driver: performance 로그가 활성화된 Chrome 드라이버
+        blog_id: 요청한 블로그 ID
+        timeout: 최대 대기 시간 (초)
+
+    Returns:
+        {"grade": 등급, "raw": 원본 응답 데이터, "source_url": 응답 URL} 또는 None
+    """
+    deadline = time.time() + timeout
+    candidates = {}  # requestId → 응답 URL
+
+    while time.time() < deadline:
+        try:
+            entries = driver.get_log("performance")
+        except Exception as e:
+            logger.warning(f"⚠️ performance 로그 조회 실패: {str(e)[:60]}")
+            return None
+
+        for entry in entries:
             try:
-                # 요소가 존재할 때까지 대기
-                url_input = WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
-                logger.info(f"✅ URL 입력 필드 찾음: {selector[:60]}...")
-                break
-            except Exception as e:
-                logger.debug(f"❌ URL 입력 필드 셀렉터 실패: {selector[:40]}... - {str(e)[:30]}")
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
                 continue
 
-        if not url_input:
-            logger.error("❌ 모든 URL 입력 필드 셀렉터 실패")
-            raise Exception("URL 입력 필드를 찾을 수 없음")
+            method = message.get("method")
+            params = message.get("params", {})
 
-        # 🔥 사용자 요청: 더블 클릭으로 필드 활성화 → 입력 → Enter
-        logger.info("📍 URL 입력 필드 더블 클릭 중...")
-        
-        # ActionChains를 사용한 더블 클릭
-        actions = ActionChains(driver)
-        actions.move_to_element(url_input).double_click().perform()
-        time.sleep(0.3)  # 0.5초 → 0.3초로 단축
-        
-        # 추가로 한 번 더 클릭하여 확실히 포커스
-        url_input.click()
-        time.sleep(0.2)  # 0.3초 → 0.2초로 단축
-        
-        logger.info("⌨️ URL 입력 중...")
-        url_input.clear()
-        # clear 후 대기 제거 (즉시 입력)
-        url_input.send_keys(blog_url)
-        
-        # React 이벤트 트리거
-        driver.execute_script("""
-            arguments[0].dispatchEvent(new Event('input', { bubbles: true }));
-            arguments[0].dispatchEvent(new Event('change', { bubbles: true }));
-        """, url_input)
-        
-        time.sleep(0.2)  # 0.5초 → 0.2초로 단축
-        
-        # Enter 키 입력
-        logger.info("⏎ Enter 키 입력 중...")
-        from selenium.webdriver.common.keys import Keys
-        url_input.send_keys(Keys.RETURN)
-        logger.info("✅ Enter 키 입력 완료 (검색 실행)")
+            if method == "Network.responseReceived":
+                response = params.get("response", {})
+                mime_type = response.get("mimeType", "")
+                if "blogdex" in response.get("url", "") and ("json" in mime_type or "x-component" in mime_type):
+                    candidates[params.get("requestId")] = response.get("url")
+
+            elif method == "Network.loadingFinished" and params.get("requestId") in candidates:
+                request_id = params["requestId"]
+                source_url = candidates.pop(request_id)
+                try:
+                    body = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+                except Exception as e:
+                    logger.debug(f"응답 본문 조회 실패: {source_url} - {str(e)[:60]}")
+                    continue
+
+                grade, raw = _parse_grade_body(
+                    body.get("body"), blog_id, scoped=url_refers_to_blog(source_url, blog_id)
+                )
+                if grade:
+                    return {"grade": grade, "raw": raw, "source_url": source_url}
+
+        time.sleep(0.2)
+
+    return None
+
+def _wait_budget(lease, timeout):
+    """
+    대여 기한을 넘지 않는 대기 시간 (min(timeout, 남은 시간))
+
+    Raises:
+        LeaseExpired: 이미 기한이 지났거나 회수된 경우
+    """
+    if lease is None:
+        return timeout
+    lease.check()
+    remaining = lease.remaining()
+    if remaining is None:
+        return timeout
+    return max(0.1, min(timeout, remaining))
+
+def _search_via_form(driver, blog_url, lease=None):
+    """홈 검색 폼에 블로그 URL을 입력하고 Enter (결과 페이지 직접 이동이 불가할 때 사용)"""
+    # 🔥 중요: 명시적으로 BlogDex 홈페이지로 이동 (드라이버 풀에서 받은 드라이버는 다른 페이지에 있을 수 있음)
+    if "blogdex.space" not in driver.current_url or "/blog/" in driver.current_url:
+        logger.info(f"📍 현재 URL: {driver.current_url} → BlogDex 홈으로 이동")
+        driver.get("https://blogdex.space/")
+        WebDriverWait(driver, _wait_budget(lease, 10)).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        # 조건부 대기: body 요소가 완전히 로드될 때까지
+        WebDriverWait(driver, _wait_budget(lease, 5)).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+        logger.info("✅ BlogDex 홈페이지 로딩 완료")
+
+    # 마우스 스크롤 (최소화)
+    actions = ActionChains(driver)
+    actions.move_by_offset(0, 10).perform()
+    time.sleep(0.3)  # 1초 → 0.3초로 단축
+
+    # 🔥 사용자 요청: URL 입력 전 강제 새로고침
+    logger.info("🔄 페이지 강제 새로고침 중...")
+    driver.refresh()
+    # 조건부 대기: 새로고침 후 입력 필드가 준비될 때까지 대기
+    refresh_wait = _wait_budget(lease, 5)
+    try:
+        WebDriverWait(driver, refresh_wait).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "#__next > div > main > div > div.flex.w-full.space-x-2 > div > input"))
+        )
+        logger.info("✅ 새로고침 완료 (입력 필드 준비됨)")
+    except:
+        # 입력 필드를 찾지 못하면 고정 대기
+        time.sleep(2)
+        logger.info("✅ 새로고침 완료 (고정 대기)")
+
+    # 🔥 Phase 5: 사용자 제공 정확한 셀렉터 사용
+    # 사용자 제공 셀렉터: #__next > div > main > div > div.flex.w-full.space-x-2 > div > input
+    url_input_selectors = [
+        # 사용자 제공 정확한 셀렉터 (최우선)
+        "#__next > div > main > div > div.flex.w-full.space-x-2 > div > input",
+        # 약간 변형된 셀렉터 (백업)
+        "#__next div.flex.w-full.space-x-2 input",
+        "div.flex.w-full.space-x-2 input",
+        # 클래스 기반
+        "input.h-14[placeholder='블로그 주소/아이디를 입력하세요.']",
+        "input.w-\\[310px\\][placeholder='블로그 주소/아이디를 입력하세요.']",
+        # placeholder 기반 (백업)
+        "input[placeholder='블로그 주소/아이디를 입력하세요.']",
+        # 구조 기반 백업
+        "main section input[type='text']",
+        "main input[placeholder]"
+    ]
+
+    url_input = None
+    for selector in url_input_selectors:
+        # 셀렉터마다 최대 15초지만 대여 기한을 넘기지 않음 (기한이 지나면 LeaseExpired)
+        selector_wait = _wait_budget(lease, 15)
+        try:
+            # 요소가 존재할 때까지 대기
+            url_input = WebDriverWait(driver, selector_wait).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            )
+            logger.info(f"✅ URL 입력 필드 찾음: {selector[:60]}...")
+            break
+        except Exception as e:
+            logger.debug(f"❌ URL 입력 필드 셀렉터 실패: {selector[:40]}... - {str(e)[:30]}")
+            continue
 
+    if not url_input:
+        logger.error("❌ 모든 URL 입력 필드 셀렉터 실패")
+        raise Exception("URL 입력 필드를 찾을 수 없음")
+
+    # 🔥 사용자 요청: 더블 클릭으로 필드 활성화 → 입력 → Enter
+    logger.info("📍 URL 입력 필드 더블 클릭 중...")
+    
+    # ActionChains를 사용한 더블 클릭
+    actions = ActionChains(driver)
+    actions.move_to_element(url_input).double_click().perform()
+    time.sleep(0.3)  # 0.5초 → 0.3초로 단축
+    
+    # 추가로 한 번 더 클릭하여 확실히 포커스
+    url_input.click()
+    time.sleep(0.2)  # 0.3초 → 0.2초로 단축
+    
+    logger.info("⌨️ URL 입력 중...")
+    url_input.clear()
+    # clear 후 대기 제거 (즉시 입력)
+    url_input.send_keys(blog_url)
+    
+    # React 이벤트 트리거
+    driver.execute_script("""
+        arguments[0].dispatchEvent(new Event('input', { bubbles: true }));
+        arguments[0].dispatchEvent(new Event('change', { bubbles: true }));
+    """, url_input)
+    
+    time.sleep(0.2)  # 0.5초 → 0.2초로 단축
+    
+    if GRADE_CAPTURE_MODE == "network":
+        # 검색 이전 요청의 로그는 버림
+        drain_performance_log(driver)
+
+    # Enter 키 입력
+    logger.info("⏎ Enter 키 입력 중...")
+    from selenium.webdriver.common.keys import Keys
+    url_input.send_keys(Keys.RETURN)
+    logger.info("✅ Enter 키 입력 완료 (검색 실행)")
+
+def _detect_grade(driver, blog_url, dom_timeout=40, lease=None):
+    """
+    검색/이동 직후 등급 감지 (네트워크 응답 → SVG 셀렉터 → 정규식 스캔 순)
+
+    Args:
+        driver: Chrome 드라이버
+        blog_url: 블로그 URL (API URL 학습용)
+        dom_timeout: SVG 셀렉터 대기 최대 시간 (초)
+        lease: 드라이버/탭 대여 (모든 대기 시간을 남은 기한 이내로 제한)
+
+    Returns:
+        (등급, 원본 응답 데이터) - 찾지 못하면 (None, None)
+    """
+    grade = None
+    raw = None
+
+    if GRADE_CAPTURE_MODE == "network":
+        # API 응답에서 바로 등급 추출 (렌더링 대기 없음)
+        capture_start = time.time()
+        captured = capture_grade_from_network(
+            driver, build_blog_id(blog_url), timeout=_wait_budget(lease, NETWORK_CAPTURE_TIMEOUT)
+        )
+        if captured:
+            grade = captured["grade"]
+            raw = captured["raw"]
+            logger.info(f"✅ 네트워크 응답에서 등급 발견: {grade} ({time.time()-capture_start:.2f}초, {captured['source_url'][:80]})")
+            # HTTP 빠른 조회용 API URL 학습
+            from http_client import blogdex_http
+            blogdex_http.learn_endpoint(captured["source_url"], blog_url)
+        else:
+            logger.warning("⚠️ 네트워크 응답에서 등급을 찾지 못함 - DOM 방식으로 진행")
+
+    if not grade:
         # 페이지 렌더링 대기 (document.readyState 확인)
+        render_wait = _wait_budget(lease, 30)
         try:
-            WebDriverWait(driver, 30).until(
+            WebDriverWait(driver, render_wait).until(
                 lambda d: d.execute_script("return document.readyState") == "complete"
             )
             logger.info("✅ 페이지 렌더링 완료")
         except Exception as e:
             logger.warning(f"⚠️ 페이지 렌더링 대기 타임아웃 (계속 진행): {str(e)[:50]}")
 
-        # 🔥 Codex 제안: 추가 안정화 대기 증가 (5초 → 8초, BlogDex React 렌더링 완료 대기)
-        time.sleep(8)
-
-        # 🔥 SVG text 셀렉터 최적화 (속성 기반)
-        # 사용자 제공 정보: font-family="Pretendard", font-size="22px", font-weight="700", fill="#e27d13"
-        # SVG text 요소: <text font-family="Pretendard" font-size="22px" font-weight="700" fill="#e27d13" x="-30" y="-60">최적1+</text>
-        grade_selectors = [
-            # 가장 정확한 셀렉터 (사용자 제공 정보 기반 - 모든 속성 매칭)
-            "svg text[font-family='Pretendard'][font-size='22px'][font-weight='700'][fill='#e27d13']",
-            "svg text[font-family='Pretendard'][font-size='22px'][font-weight='700']",
-            "svg text[font-size='22px'][font-weight='700']",
-            "svg text[fill='#e27d13'][font-size='22px']",
-            "svg text[font-family='Pretendard'][font-size='22px']",
-            # 속성 기반 셀렉터 (가장 안정적 - Pretendard 폰트 사용)
-            "svg text[font-family='Pretendard']",
-            "svg text[font-weight='700']",
-            "svg text[font-size='22px']",
-            # fill 색상 기반 (주황색 #e27d13)
-            "svg text[fill='#e27d13']",
-            "svg text[fill*='e27d13']",
-            # nth-child 기반 (기존 방식)
-            "svg > text:nth-child(2)",
-            "div[class*='justify-center'] svg > text:nth-child(2)",
-            # 원래 셀렉터 (백업)
-            "#__next > div > main > div > div.flex.flex-col.gap-4 > div:nth-child(1) > div.p-6.pt-0 > div.flex.flex-col.justify-center.space-y-12.py-5.md\\:flex-row.md\\:justify-between.md\\:space-x-0.md\\:space-y-0.md\\:py-0 > div.flex.flex-1.justify-center.px-5 > div > svg > text:nth-child(2)",
-            # 넓은 범위 (마지막 백업)
-            "#__next svg > text:nth-child(2)"
-        ]
-
-        grade_element = None
-        last_error = None
-
-        logger.info(f"⏱️  등급 요소 대기 시작 (최대 40초)")
-        for idx, selector in enumerate(grade_selectors, 1):
-            try:
-                logger.debug(f"🔍 등급 셀렉터 {idx}/{len(grade_selectors)} 시도: {selector[:50]}...")
-                # 🔥 중요: 대기 시간 30초 → 40초로 증가 (BlogDex 로딩 시간 고려)
-                grade_element = WebDriverWait(driver, 40, poll_frequency=0.5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
-                # 요소가 보이는지 확인
-                if not grade_element.is_displayed():
-                    logger.warning(f"⚠️ 등급 요소가 숨겨져 있음, 계속 시도...")
-                    continue
-                logger.info(f"✅ 등급 셀렉터 {idx} 성공!")
-                break
-            except Exception as e:
-                last_error = e
-                logger.warning(f"❌ 등급 셀렉터 {idx} 실패: {str(e)[:80]}")
-                continue
+        # 모든 등급 셀렉터를 한 번에 검사하며 렌더링되는 즉시 진행
+        logger.info(f"⏱️  등급 요소 대기 시작 (최대 {dom_timeout:.0f}초)")
+        wait_start = time.time()
+        hit = wait_for_grade(driver, timeout=_wait_budget(lease, dom_timeout))
+
+        if hit:
+            grade = hit["grade"]
+            logger.info(f"✅ 등급 감지: {grade} ({time.time()-wait_start:.2f}초, 셀렉터: {hit['selector'][:60]})")
+        else:
+            # 폴백: 페이지 전체 텍스트 정규식 스캔
+            logger.warning("⚠️ 등급 셀렉터 타임아웃 - 정규식 스캔으로 재시도")
+            grade = scan_grade_text(driver)
+            if grade:
+                logger.info(f"✅ 정규식으로 등급 발견: {grade}")
+
+    return grade, raw
+
+def get_result_url(blog_url):
+    """
+    블로그의 결과 페이지 URL (BLOGDEX_RESULT_URL 설정 또는 검색 폼 성공 시 학습한 경로 기준)
+
+    Returns:
+        결과 페이지 URL 또는 None (아직 경로를 모르는 경우)
+    """
+    template = RESULT_URL_TEMPLATE or _learned_result_template
+    if not template:
+        return None
+    return template.replace("{blog_id}", build_blog_id(blog_url))
+
+def _learn_result_url(current_url, blog_url):
+    """검색 폼으로 도착한 결과 페이지 URL에서 {blog_id} 경로 템플릿 학습"""
+    global _learned_result_template
+
+    if RESULT_URL_TEMPLATE or _learned_result_template or "/blog/" not in current_url:
+        return
+
+    parsed = urlparse(current_url)
+    blog_id = build_blog_id(blog_url)
+    segments = parsed.path.split('/')
+    if blog_id not in segments:
+        return
+
+    path = '/'.join("{blog_id}" if segment == blog_id else segment for segment in segments)
+    _learned_result_template = f"{parsed.scheme}://{parsed.netloc}{path}"
+    logger.info(f"✅ 결과 페이지 경로 학습: {_learned_result_template}")
+
+def _extract_grade_direct(driver, blog_url, lease=None):
+    """
+    검색 폼을 거치지 않고 결과 페이지로 바로 이동하여 등급 추출
+
+    Returns:
+        (등급, 원본 응답 데이터) - 실패 시 (None, None)
+    """
+    result_url = get_result_url(blog_url)
+    if not result_url:
+        return None, None
+
+    logger.info(f"🎯 결과 페이지 직접 이동: {result_url}")
+    if GRADE_CAPTURE_MODE == "network":
+        drain_performance_log(driver)
+    driver.get(result_url)
+
+    grade, raw = _detect_grade(driver, blog_url, dom_timeout=DIRECT_NAVIGATION_TIMEOUT, lease=lease)
+    if not grade:
+        logger.warning("⚠️ 결과 페이지 직접 이동으로 등급을 찾지 못함 - 검색 폼으로 폴백")
+    return grade, raw
+
+def _check_lease(lease):
+    if lease is not None:
+        lease.check()
+
+def extract_blog_grade(driver, blog_url, lease=None):
+    """
+    블로그 URL의 등급을 추출 (결과 페이지 직접 이동 → 검색 폼 순)
+
+    Args:
+        lease: 드라이버/탭 대여 (페이지 동작 사이마다 기한을 확인하고, 각 대기 시간을 남은 기한 이내로 제한,
+               기한이 지나면 LeaseExpired 발생)
+    """
+    try:
+        logger.info(f"🚀 extract_blog_grade 시작: {blog_url}")
 
-        if not grade_element:
-            # 수정 3: 에러 정보를 더 상세히 보존
-            import traceback
-            error_detail = traceback.format_exc()
-            logger.error(f"❌ 모든 등급 셀렉터 실패. 마지막 에러:\n{error_detail}")
-            raise Exception(f"등급 요소를 찾을 수 없음. 마지막 에러: {str(last_error)}")
+        _check_lease(lease)
+        grade, raw = None, None
+        if DIRECT_NAVIGATION:
+            grade, raw = _extract_grade_direct(driver, blog_url, lease)
 
-        grade = grade_element.text.strip()
+        if not grade:
+            _check_lease(lease)
+            _search_via_form(driver, blog_url, lease)
+            _check_lease(lease)
+            grade, raw = _detect_grade(driver, blog_url, lease=lease)
+            if grade:
+                _learn_result_url(driver.current_url, blog_url)
 
         if not grade:
-            raise Exception("등급 텍스트가 비어있음")
+            logger.error("❌ 등급 셀렉터 및 정규식 스캔 모두 실패")
+            raise Exception("등급 요소를 찾을 수 없음 (셀렉터 40초 대기 + 정규식 스캔 실패)")
 
         # 등급 매핑 (get_level_info 사용)
         level_info = get_level_info(grade)
@@ -419,12 +930,16 @@ def extract_blog_grade(driver, blog_url):
                 "level_en": level_info.get("level_en"),
                 "tier": level_info.get("tier"),
                 "tier_en": level_info.get("tier_en"),
-                "tier_rank": level_info.get("tier_rank")
+                "tier_rank": level_info.get("tier_rank"),
+                "raw": raw
             }
         else:
             # 매핑 실패 시 기본값
             print(f"[DEBUG] 추출된 등급: '{grade}' (매핑 실패)")
-            return {"grade": grade, "level": grade}
+            return {"grade": grade, "level": grade, "raw": raw}
+    except LeaseExpired:
+        # 기한 초과는 호출자가 처리 (드라이버를 더 쓰지 않고 바로 반환)
+        raise
     except Exception as e:
         # 수정 3: 에러 정보를 상세히 출력
         import traceback
@@ -494,74 +1009,16 @@ def crawl_blog_grade(url: str) -> dict:
         # 로그인 필요시
         if not skip_login:
             print("[INFO] 로그인 필요 - 구글 OAuth 시작")
-            # 팝업 닫기
-            try:
-                driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
-                time.sleep(3)
-            except:
-                pass
-            
-            # 로그인 버튼들 클릭
             try:
-                first_button_selector = "#radix-\\:R7336\\:"
-                first_button = WebDriverWait(driver, 10).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, first_button_selector))
-                )
-                first_button.click()
-                time.sleep(3)
-                
-                login_button_selector = "#radix-\\:R7336H1\\: > div:nth-child(5) > span"
-                login_button = WebDriverWait(driver, 10).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, login_button_selector))
-                )
-                login_button.click()
-                time.sleep(3)
-                
-                terms_button = WebDriverWait(driver, 10).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "#terms"))
-                )
-                terms_button.click()
-                time.sleep(3)
-            except:
-                pass
-            
-            # 구글 로그인
-            google_selectors = [
-                "button:has(svg[data-icon='google'])",
-                "button.bg-primary:has(svg)",
-                "#__next > div > main > div > div > div.grid.gap-2 > button:nth-child(1)"
-            ]
-            
-            try:
-                # 구글 버튼 클릭 재시도
-                google_click_success = retry_with_backoff(
-                    lambda: click_with_retry(driver, google_selectors, max_retries=1, wait_time=7),
-                    max_retries=3,
-                    backoff_factor=2
-                )
-
-                if google_click_success:
-                    time.sleep(7)
-                    print("[INFO] 구글 로그인 페이지 이동 완료")
-
-                    # 로그인도 재시도 (최대 2회)
-                    login_success = retry_with_backoff(
-                        lambda: login_google(driver),
-                        max_retries=2,
-                        backoff_factor=3
-                    )
-
-                    if not login_success:
-                        print(f"[ERROR] 구글 로그인 실패 (재시도 소진)")
-                        return {
-                            "url": url,
-                            "level": None,
-                            "success": False,
-                            "error": "구글 로그인 실패 (2회 재시도 실패)"
-                        }
-
-                    print(f"[INFO] 로그인 완료 ({time.time()-start_time:.2f}초)")
-                    save_cookies(driver, "cookies.pkl")
+                if not perform_login(driver):
+                    print(f"[ERROR] 구글 로그인 실패 (재시도 소진)")
+                    return {
+                        "url": url,
+                        "level": None,
+                        "success": False,
+                        "error": "구글 로그인 실패 (2회 재시도 실패)"
+                    }
+                print(f"[INFO] 로그인 완료 ({time.time()-start_time:.2f}초)")
 
             except Exception as e:
                 print(f"[ERROR] 로그인 프로세스 실패: {e}")
@@ -601,14 +1058,12 @@ def crawl_blog_grade(url: str) -> dict:
                     success=True,
                     error=None
                 )
+                if result.get('raw') is not None:
+                    # 네트워크 수집 모드: API 원본 응답도 함께 보관
+                    response_data["raw"] = result['raw']
 
                 # 파일로 저장
-                try:
-                    file_path = persist_result(response_data)
-                    if file_path:
-                        response_data["file_path"] = file_path
-                except Exception as e:
-                    print(f"[WARNING] 파일 저장 실패 (결과는 반환): {e}")
+                _save_result(response_data)
 
                 return response_data
             else:
@@ -624,12 +1079,7 @@ def crawl_blog_grade(url: str) -> dict:
                 )
 
                 # 실패도 파일로 저장
-                try:
-                    file_path = persist_result(response_data)
-                    if file_path:
-                        response_data["file_path"] = file_path
-                except Exception as e:
-                    print(f"[WARNING] 파일 저장 실패: {e}")
+                _save_result(response_data)
 
                 return response_data
         except Exception as e:
@@ -643,12 +1093,7 @@ def crawl_blog_grade(url: str) -> dict:
                 error=f"등급 추출 실패: {str(e)}"
             )
 
-            try:
-                file_path = persist_result(response_data)
-                if file_path:
-                    response_data["file_path"] = file_path
-            except:
-                pass
+            _save_result(response_data)
 
             return response_data
 
@@ -665,12 +1110,7 @@ def crawl_blog_grade(url: str) -> dict:
             error=str(e)
         )
 
-        try:
-            file_path = persist_result(response_data)
-            if file_path:
-                response_data["file_path"] = file_path
-        except:
-            pass
+        _save_result(response_data)
 
         return response_data
     finally:
@@ -762,7 +1202,163 @@ def crawl_blog_grade(url: str) -> dict:
                 print(f"[ERROR] 프로세스 종료 중 예외: {e}")
 
 
-def crawl_blog_grade_with_pool(url: str) -> dict:
+def crawl_blog_grade_http(url: str, deadline=None):
+    """
+    브라우저 없이 세션 쿠키로 등급 API를 직접 호출 (CRAWL_MODE=http)
+
+    Args:
+        url: 블로그 URL
+        deadline: 작업 마감 시각 (epoch 초, 요청 타임아웃을 남은 시간 이내로 제한)
+
+    Returns:
+        crawl_blog_grade_with_pool과 같은 형식의 결과, 또는 None (Chrome 크롤링으로 폴백 필요)
+    """
+    from http_client import blogdex_http
+
+    if not blogdex_http.available:
+        return None
+
+    start_time = time.time()
+    timeout = None
+    if deadline is not None:
+        if deadline <= start_time:
+            return None
+        timeout = min(blogdex_http.timeout, deadline - start_time)
+    fetched = blogdex_http.fetch_grade(url, timeout=timeout)
+    if not fetched:
+        return None
+
+    print(f"[SUCCESS - HTTP] 등급: {fetched['grade']} ({time.time()-start_time:.2f}초)")
+    return _build_result(url, fetched)
+
+def check_http_mode_config():
+    """CRAWL_MODE=http인데 HTTP 빠른 조회를 쓸 수 없는 설정이면 경고 (서버 시작 시 호출)"""
+    from http_client import blogdex_http, httpx
+
+    if CRAWL_MODE != "http":
+        return
+    if httpx is None:
+        logger.warning("⚠️ CRAWL_MODE=http 이지만 httpx가 설치되지 않음 - 항상 Chrome 크롤링 사용")
+    elif not blogdex_http.endpoint_template and GRADE_CAPTURE_MODE != "network":
+        logger.warning(
+            "⚠️ CRAWL_MODE=http 이지만 BLOGDEX_GRADE_API_URL이 없고 GRADE_CAPTURE_MODE=network도 아님 "
+            "- 등급 API URL을 알 수 없어 항상 Chrome 크롤링 사용"
+        )
+
+def _probe_grade(driver, blog_id=None):
+    """
+    현재 탭에서 등급 요소 1회 검사
+    blog_id를 주면 탭이 그 블로그의 결과 페이지로 이동한 뒤에만 검사 (이전 페이지의 등급을 읽지 않도록)
+    """
+    if blog_id is not None and not url_refers_to_blog(driver.current_url, blog_id):
+        return None
+    return driver.execute_script(PROBE_GRADE_SCRIPT, GRADE_SELECTORS, list(GRADE_MAPPING.keys()))
+
+def _start_navigation(driver, target_url):
+    """페이지 이동을 시작만 하고 로딩 완료를 기다리지 않음 (다른 탭이 잠금을 쓸 수 있도록)"""
+    driver.execute_script("window.location.href = arguments[0];", target_url)
+
+def crawl_blog_grade_with_tabs(url: str, deadline=None) -> dict:
+    """
+    탭 단위로 드라이버를 공유하는 크롤링 (TABS_PER_DRIVER > 1)
+
+    결과 페이지로 이동을 시작한 뒤 잠금을 풀고, 짧은 주기로 탭을 전환하며 등급을 확인하므로
+    같은 Chrome의 다른 탭들이 동시에 조회를 진행할 수 있음.
+    결과 페이지 경로를 모르거나 찾지 못하면 탭을 반환하고 driver_pool에서 별도 드라이버를 빌려
+    검색 폼 방식으로 처리 (공유 브라우저의 잠금을 오래 붙잡지 않도록)
+
+    Args:
+        url: 블로그 URL
+        deadline: 작업 마감 시각 (epoch 초, 지나면 다음 탭 동작 전에 중단)
+
+    Returns:
+        crawl_blog_grade_with_pool과 같은 형식의 결과
+    """
+    from driver_pool import driver_pool
+    from tab_pool import tab_pool
+
+    start_time = time.time()
+    print(f"[크롤링 시작 - 탭 공유] {url}")
+
+    lease = None
+    try:
+        lease = tab_pool.acquire(timeout=30, deadline=deadline)
+
+        grade = None
+        blog_id = build_blog_id(url)
+        result_url = get_result_url(url)
+        if result_url:
+            lease.run(_start_navigation, result_url)
+
+            poll_until = time.time() + DIRECT_NAVIGATION_TIMEOUT
+            while time.time() < poll_until:
+                time.sleep(0.3)
+                lease.check()
+                try:
+                    hit = lease.run(_probe_grade, blog_id)
+                except LeaseExpired:
+                    raise
+                except Exception as e:
+                    logger.debug(f"탭 등급 확인 재시도: {str(e)[:60]}")
+                    continue
+                if hit:
+                    grade = hit["grade"]
+                    break
+
+        if grade:
+            extracted = {"grade": grade}
+        else:
+            # 폴백: 탭을 먼저 반환하고 전용 드라이버로 기존 방식(직접 이동 → 검색 폼) 수행
+            # (검색 폼은 최대 수십 초 걸리므로 공유 브라우저 잠금 안에서 실행하면 다른 탭이 모두 멈춤)
+            logger.warning("⚠️ 탭 공유 조회 실패 - 전용 드라이버로 검색 폼 방식 폴백")
+            lease.check()
+            lease.release()
+            lease = None
+            with driver_pool.acquire(timeout=30, deadline=deadline) as driver_lease:
+                extracted = extract_blog_grade(driver_lease.driver, url, lease=driver_lease)
+
+        if extracted:
+            print(f"[SUCCESS - 탭] 등급: {extracted['grade']} ({time.time()-start_time:.2f}초)")
+            return _build_result(url, extracted)
+
+        print(f"[ERROR] 등급 추출 실패 ({time.time()-start_time:.2f}초)")
+        return _build_result(url, None, "등급 추출 실패")
+
+    except Exception as e:
+        print(f"[ERROR] 크롤링 예외 발생 ({time.time()-start_time:.2f}초): {e}")
+        return _build_result(url, None, str(e))
+    finally:
+        if lease:
+            lease.release()
+
+def _save_result(response_data):
+    """
+    결과 저장 요청 (실제 디스크 쓰기는 백그라운드 저장 스레드가 처리하여 드라이버를 붙잡지 않음)
+    저장 실패는 결과 반환에 영향을 주지 않음
+    """
+    try:
+        file_path = persist_result_async(response_data)
+        if file_path:
+            response_data["file_path"] = file_path
+    except Exception as e:
+        print(f"[WARNING] 결과 저장 실패 (결과는 반환): {e}")
+
+def _build_result(url, extracted, error=None):
+    """추출 결과를 응답 형식으로 보강하고 저장"""
+    response_data = enrich_result(
+        url=url,
+        grade=extracted.get('grade') if extracted else None,
+        success=bool(extracted),
+        error=error
+    )
+    if extracted and extracted.get('raw') is not None:
+        response_data["raw"] = extracted['raw']
+
+    _save_result(response_data)
+
+    return response_data
+
+def crawl_blog_grade_with_pool(url: str, deadline=None) -> dict:
     """
     드라이버 풀을 사용한 최적화된 크롤링 (Phase 2)
 
@@ -771,6 +1367,7 @@ def crawl_blog_grade_with_pool(url: str) -> dict:
 
     Args:
         url: 블로그 URL
+        deadline: 작업 마감 시각 (epoch 초, 지나면 다음 페이지 동작 전에 중단)
 
     Returns:
         {
@@ -788,11 +1385,12 @@ def crawl_blog_grade_with_pool(url: str) -> dict:
     print(f"[크롤링 시작 - 풀 사용] {url}")
     print(f"{'='*60}")
 
-    driver = None
+    lease = None
     try:
-        # 드라이버 풀에서 가져오기
+        # 드라이버 풀에서 기한 있는 대여로 가져오기
         print("[1/2] 드라이버 풀에서 가져오는 중...")
-        driver = driver_pool.get(timeout=30)
+        lease = driver_pool.acquire(timeout=30, deadline=deadline)
+        driver = lease.driver
         print(f"[INFO] 드라이버 준비 완료 ({time.time()-start_time:.2f}초)")
 
         # 이미 BlogDex 메인 페이지에 로그인된 상태
@@ -802,7 +1400,7 @@ def crawl_blog_grade_with_pool(url: str) -> dict:
         try:
             # 최대 3회 재시도
             result = retry_with_backoff(
-                lambda: extract_blog_grade(driver, url),
+                lambda: extract_blog_grade(driver, url, lease=lease),
                 max_retries=3,
                 backoff_factor=2
             )
@@ -818,14 +1416,12 @@ def crawl_blog_grade_with_pool(url: str) -> dict:
                     success=True,
                     error=None
                 )
+                if result.get('raw') is not None:
+                    # 네트워크 수집 모드: API 원본 응답도 함께 보관
+                    response_data["raw"] = result['raw']
 
                 # 파일로 저장
-                try:
-                    file_path = persist_result(response_data)
-                    if file_path:
-                        response_data["file_path"] = file_path
-                except Exception as e:
-                    print(f"[WARNING] 파일 저장 실패 (결과는 반환): {e}")
+                _save_result(response_data)
 
                 return response_data
             else:
@@ -841,12 +1437,7 @@ def crawl_blog_grade_with_pool(url: str) -> dict:
                 )
 
                 # 실패도 파일로 저장
-                try:
-                    file_path = persist_result(response_data)
-                    if file_path:
-                        response_data["file_path"] = file_path
-                except Exception as e:
-                    print(f"[WARNING] 파일 저장 실패: {e}")
+                _save_result(response_data)
 
                 return response_data
         except Exception as e:
@@ -860,12 +1451,7 @@ def crawl_blog_grade_with_pool(url: str) -> dict:
                 error=f"등급 추출 실패: {str(e)}"
             )
 
-            try:
-                file_path = persist_result(response_data)
-                if file_path:
-                    response_data["file_path"] = file_path
-            except:
-                pass
+            _save_result(response_data)
 
             return response_data
 
@@ -882,19 +1468,14 @@ def crawl_blog_grade_with_pool(url: str) -> dict:
             error=str(e)
         )
 
-        try:
-            file_path = persist_result(response_data)
-            if file_path:
-                response_data["file_path"] = file_path
-        except:
-            pass
+        _save_result(response_data)
 
         return response_data
     finally:
-        # 드라이버를 풀에 반환 (quit하지 않음)
-        if driver:
+        # 드라이버를 풀에 반환 (quit하지 않음, 이미 회수된 대여면 건너뜀)
+        if lease:
             try:
-                driver_pool.put(driver)
+                lease.release()
                 print("[INFO] 드라이버 풀에 반환 완료")
             except Exception as e:
                 print(f"[ERROR] 드라이버 반환 실패: {e}")
@@ -3,7 +3,12 @@ Chrome 드라이버 풀 관리
 서버 시작 시 미리 생성된 드라이버를 재사용하여 성능 향상
 """
 
+from concurrent.futures import ThreadPoolExecutor, wait
+from collections import deque
+from pathlib import Path
 from queue import Queue, Empty
+import os
+import random
 import threading
 import time
 import logging
@@ -11,23 +16,140 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+BLOGDEX_HOME = "https://blogdex.space/"
+
+# 🔥 Phase 4: 메인 검색 필드만 정확히 타겟팅 (디버그 스크립트 결과 기반)
+URL_INPUT_SELECTORS = [
+    "input[placeholder='블로그 주소/아이디를 입력하세요.']",
+    "input.h-14[type='text']",
+    "input[type='text'][placeholder*='블로그 주소/아이디']",
+    "main section input[type='text']"
+]
+
+
+class LeaseExpired(Exception):
+    """드라이버 대여 기한이 지났거나 풀이 드라이버를 회수한 경우"""
+    pass
+
+
+class DriverLease:
+    """기한이 있는 드라이버 대여 (크롤링 단계 사이마다 check()로 기한 확인)"""
+
+    def __init__(self, pool, driver, deadline=None):
+        self.pool = pool
+        self.driver = driver
+        self.deadline = deadline
+        self.acquired_at = time.time()
+        self.revoked = False
+        self.released = False
+
+    def remaining(self):
+        """남은 시간 (초, 기한 없으면 None)"""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.time()
+
+    def check(self):
+        """
+        기한 확인 (페이지 동작 사이에 호출)
+
+        Raises:
+            LeaseExpired: 기한 초과 또는 회수된 경우
+        """
+        if self.revoked:
+            raise LeaseExpired("드라이버가 풀에 회수되었습니다")
+        if self.deadline is not None and time.time() > self.deadline:
+            raise LeaseExpired(f"드라이버 대여 기한 초과 ({time.time() - self.acquired_at:.0f}초 사용)")
+
+    def release(self):
+        self.pool.release(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
 class DriverPool:
     """Chrome 드라이버 풀 관리 클래스"""
 
-    def __init__(self, size=3):
+    def __init__(self, min_size=3, max_size=None, warmup_parallelism=None,
+                 scale_interval=5, scale_up_wait=5, idle_cooldown=300, driver_memory_mb=500,
+                 recycle_workers=2, profile_root=None, health_interval=30, max_uses=200,
+                 max_age=3600, max_rss_mb=1500, cookie_margin=300, lease_grace=15):
         """
         Args:
-            size: 풀에 유지할 드라이버 개수 (기본 3개)
+            min_size: 항상 유지할 드라이버 개수 (기본 3개, 서버 시작 시 생성)
+            max_size: 부하에 따라 늘릴 수 있는 최대 드라이버 개수 (기본: min_size)
+            warmup_parallelism: 초기화 시 동시에 준비할 드라이버 수 (기본: min_size)
+            scale_interval: 오토스케일러 점검 주기 (초)
+            scale_up_wait: 최근 get() 대기 시간이 이 값(초)을 넘으면 드라이버 추가
+            idle_cooldown: 이 시간(초) 이상 쓰이지 않은 드라이버는 min_size까지 축소
+            driver_memory_mb: 드라이버 1개당 예상 메모리 (가용 메모리 부족 시 증설 중단)
+            recycle_workers: 반환된 드라이버를 정리하는 백그라운드 스레드 수
+            profile_root: 슬롯별 Chrome 프로필을 유지할 디렉터리 (None이면 매번 임시 프로필)
+                          재시작/교체된 드라이버가 로그인 상태와 HTTP 캐시를 그대로 이어받음
+            health_interval: 유휴 드라이버 상태 점검 주기 (초, 0이면 점검 안 함)
+            max_uses: 드라이버 1개의 최대 사용 횟수 (초과 시 교체, 0이면 제한 없음)
+            max_age: 드라이버 최대 수명 (초, 초과 시 교체, 0이면 제한 없음)
+            max_rss_mb: Chrome 프로세스 메모리 상한 (MB, 초과 시 교체, psutil 필요, 0이면 제한 없음)
+            cookie_margin: 로그인 쿠키 만료까지 남은 시간이 이 값(초)보다 적으면 교체
+            lease_grace: 대여 기한이 지난 뒤 이 시간(초)이 더 지나도 반환되지 않으면 드라이버 회수
         """
-        self.pool = Queue(maxsize=size)
-        self.size = size
+        self.min_size = min_size
+        self.max_size = max(min_size, max_size or min_size)
+        self.pool = Queue(maxsize=self.max_size)
+        self.size = 0  # 현재 살아있는 드라이버 수 (풀 대기 + 사용 중)
+        self.warmup_parallelism = max(1, warmup_parallelism or min_size)
+        self.scale_interval = scale_interval
+        self.scale_up_wait = scale_up_wait
+        self.idle_cooldown = idle_cooldown
+        self.driver_memory_mb = driver_memory_mb
         self.lock = threading.Lock()
         self.initialized = False
-
-    def initialize(self):
+        self.closing = False
+        self._first_ready = threading.Event()
+        self._warmup_pending = 0
+        # 오토스케일링 상태
+        self.waiting = 0       # get()에서 대기 중인 스레드 수
+        self.creating = 0      # 증설 중인 드라이버 수
+        self._wait_samples = deque(maxlen=100)  # (시각, 대기 시간)
+        self._last_used = {}   # id(driver) → 마지막 반환 시각
+        self._meta = {}        # id(driver) → {"created", "expires": 교체 시각, "uses": 사용 횟수, "session": 세션 세대}
+        self._demand_probe = None
+        self._stop_event = threading.Event()
+        self._autoscaler = None
+        # 반환된 드라이버 정리용 백그라운드 스레드
+        self.recycle_workers = recycle_workers
+        self.recycling = 0
+        self._recycler = None
+        # 슬롯별 프로필 (같은 프로필을 두 Chrome이 동시에 쓰지 않도록 슬롯 단위로 대여)
+        self.profile_root = profile_root
+        # 상태 점검 및 선제 교체 기준
+        self.health_interval = health_interval
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self.max_rss_mb = max_rss_mb
+        self.cookie_margin = cookie_margin
+        self._health_checker = None
+        self._lease_reclaimer = None
+        self.replaced = 0  # 선제 교체된 드라이버 누적 수
+        # 대여 중인 드라이버 (id(driver) → DriverLease)
+        self.lease_grace = lease_grace
+        self._leases = {}
+        self.reclaimed = 0  # 기한 초과로 회수된 대여 누적 수
+        self._free_slots = list(range(self.max_size))
+        self._slot_of = {}  # id(driver) → 슬롯 번호
+
+    def initialize(self, wait_all=False):
         """
         서버 시작 시 드라이버 풀 초기화
-        각 드라이버를 생성하고 BlogDex에 로그인까지 완료
+        드라이버 생성 및 BlogDex 로그인을 병렬로 진행하고,
+        로그인된 첫 번째 드라이버가 준비되면 바로 반환 (나머지는 백그라운드에서 계속 준비)
+
+        Args:
+            wait_all: True면 모든 드라이버 준비가 끝날 때까지 대기
         """
         if self.initialized:
             print("[INFO] 드라이버 풀이 이미 초기화되어 있습니다")
@@ -37,65 +159,643 @@ class DriverPool:
             if self.initialized:
                 return
 
-            print(f"[INFO] 드라이버 풀 초기화 시작... (크기: {self.size})")
+            print(f"[INFO] 드라이버 풀 초기화 시작... (크기: {self.min_size}~{self.max_size}, 동시 준비: {self.warmup_parallelism})")
 
-            from crawler import create_undetected_driver, load_cookies, verify_login_status, save_cookies, login_google
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.common.keys import Keys
+            self.closing = False
+            self._stop_event.clear()
+            self._first_ready.clear()
+            self._warmup_pending = self.min_size
 
-            for i in range(self.size):
-                try:
-                    print(f"[INFO] 드라이버 {i+1}/{self.size} 생성 중...")
-
-                    # 드라이버 생성
-                    driver = create_undetected_driver()
-                    if not driver:
-                        print(f"[ERROR] 드라이버 {i+1} 생성 실패")
-                        continue
-
-                    # BlogDex 접속
-                    driver.get("https://blogdex.space/")
-                    WebDriverWait(driver, 5).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "body"))
-                    )
-
-                    # 쿠키 로드 및 로그인 확인
-                    cookie_loaded = load_cookies(driver, "cookies.pkl")
-                    logged_in = False
-
-                    if cookie_loaded:
-                        driver.refresh()
-                        time.sleep(1)
-
-                        if verify_login_status(driver):
-                            logged_in = True
-                            print(f"[INFO] 드라이버 {i+1} 쿠키 로그인 성공")
-                            time.sleep(2)  # 페이지 안정화
-
-                    # 로그인 안 되어있으면 스킵 (첫 드라이버만 로그인 시도)
-                    if not logged_in and i == 0:
-                        print(f"[WARNING] 드라이버 {i+1} 로그인 필요 - 수동 로그인 후 재시작 필요")
-                        # 첫 드라이버는 로그인 안 되어도 풀에 추가 (나중에 수동 로그인 가능)
-
-                    # 메인 페이지로 이동
-                    driver.get("https://blogdex.space/")
-                    WebDriverWait(driver, 5).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "body"))
-                    )
-
-                    # 풀에 추가
-                    self.pool.put(driver)
-                    print(f"[INFO] 드라이버 {i+1}/{self.size} 초기화 완료")
-
-                except Exception as e:
-                    print(f"[ERROR] 드라이버 {i+1} 초기화 실패: {e}")
-                    import traceback
-                    traceback.print_exc()
+            executor = ThreadPoolExecutor(
+                max_workers=self.warmup_parallelism,
+                thread_name_prefix="driver-warmup"
+            )
+            futures = [executor.submit(self._warmup_one, i) for i in range(self.min_size)]
+            executor.shutdown(wait=False)
 
+            self._recycler = ThreadPoolExecutor(
+                max_workers=max(1, self.recycle_workers),
+                thread_name_prefix="driver-recycle"
+            )
+
+            # get()은 준비된 드라이버가 생길 때까지 큐에서 대기하므로 바로 사용 가능 상태로 전환
             self.initialized = True
-            print(f"[INFO] 드라이버 풀 초기화 완료 (사용 가능: {self.pool.qsize()}/{self.size})")
+
+            if self.max_size > self.min_size:
+                self._autoscaler = threading.Thread(
+                    target=self._autoscale_loop, name="driver-autoscaler", daemon=True
+                )
+                self._autoscaler.start()
+
+            if self.health_interval > 0:
+                self._health_checker = threading.Thread(
+                    target=self._health_loop, name="driver-health", daemon=True
+                )
+                self._health_checker.start()
+
+            # 기한 초과 대여 회수는 상태 점검 설정(DRIVER_HEALTH_INTERVAL=0)과 관계없이 항상 실행
+            self._lease_reclaimer = threading.Thread(
+                target=self._reclaim_loop, name="driver-lease-reclaim", daemon=True
+            )
+            self._lease_reclaimer.start()
+
+        if wait_all:
+            wait(futures)
+        else:
+            self._first_ready.wait()
+        print(f"[INFO] 드라이버 풀 사용 가능 (준비 완료: {self.pool.qsize()}/{self.min_size})")
+
+    def _warmup_one(self, index):
+        """초기화 작업 스레드: 드라이버 1개 준비 후 풀에 추가"""
+        from crawler import verify_login_status
+
+        name = f"드라이버 {index+1}/{self.min_size}"
+        try:
+            print(f"[INFO] {name} 생성 중...")
+            # 초기화 시에는 로그인 안 되어도 풀에 추가 (나중에 수동 로그인 가능)
+            driver = self._create_ready_driver(name, require_login=False)
+            if driver:
+                logged_in = verify_login_status(driver)
+                if not self._add_driver(driver):
+                    return
+                # 로그인된 드라이버가 준비된 경우에만 사용 가능 상태로 전환
+                # (로그인 안 된 드라이버만 있으면 모든 준비 작업이 끝날 때까지 대기)
+                if logged_in:
+                    self._first_ready.set()
+                print(f"[INFO] {name} 초기화 완료")
+        except Exception as e:
+            print(f"[ERROR] {name} 초기화 실패: {e}")
+            import traceback
+            traceback.print_exc()
+        finally:
+            with self.lock:
+                self._warmup_pending -= 1
+                done = self._warmup_pending == 0
+            if done:
+                # 로그인된 드라이버가 하나도 없거나 모두 실패한 경우에도 initialize()가 무한 대기하지 않도록 해제
+                if not self._first_ready.is_set():
+                    print("[WARNING] 로그인된 드라이버 없이 초기화 완료 - 로그인되지 않은 드라이버로 시작")
+                self._first_ready.set()
+                print(f"[INFO] 드라이버 풀 초기화 완료 (사용 가능: {self.pool.qsize()}/{self.min_size})")
+
+    def _add_driver(self, driver):
+        """새로 준비된 드라이버를 풀에 등록 (종료 중이면 폐기)"""
+        from session_manager import session_manager
+
+        if self.closing:
+            self._quit(driver)
+            return False
+        with self.lock:
+            self.size += 1
+            self._last_used[id(driver)] = time.time()
+            now = time.time()
+            # 함께 생성된 드라이버가 한꺼번에 교체되지 않도록 수명을 최대 10% 분산
+            expires = now + self.max_age * random.uniform(0.9, 1.0) if self.max_age else None
+            self._meta[id(driver)] = {
+                "created": now, "expires": expires, "uses": 0,
+                "session": session_manager.generation
+            }
+        self.pool.put(driver)
+        return True
+
+    def _discard(self, driver):
+        """드라이버를 풀 집계에서 제외 (종료는 호출자 책임)"""
+        with self.lock:
+            self.size -= 1
+            self._last_used.pop(id(driver), None)
+            self._meta.pop(id(driver), None)
+
+    def _quit(self, driver):
+        """드라이버 종료 후 프로필 슬롯 반환 (Chrome이 완전히 종료된 뒤에 슬롯을 돌려줌)"""
+        try:
+            driver.quit()
+        except:
+            pass
+        with self.lock:
+            slot = self._slot_of.pop(id(driver), None)
+            if slot is not None:
+                self._free_slots.append(slot)
+
+    def _take_profile(self):
+        """
+        비어 있는 프로필 슬롯 대여
+
+        Returns:
+            (슬롯 번호, 프로필 경로) 또는 (None, None) (프로필 미사용/슬롯 없음)
+        """
+        if not self.profile_root:
+            return None, None
+        with self.lock:
+            if not self._free_slots:
+                return None, None
+            # 낮은 번호부터 사용해야 재시작 후에도 같은 프로필(로그인/캐시)을 재사용
+            self._free_slots.sort()
+            slot = self._free_slots.pop(0)
+
+        profile_dir = Path(self.profile_root) / f"slot_{slot}"
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        # 이전 프로세스가 비정상 종료되며 남긴 잠금 파일 정리 (슬롯은 이 풀만 사용)
+        for lock_name in ("SingletonLock", "SingletonSocket", "SingletonCookie"):
+            try:
+                (profile_dir / lock_name).unlink()
+            except (FileNotFoundError, OSError):
+                pass
+        return slot, str(profile_dir.resolve())
+
+    def _release_slot(self, slot):
+        if slot is None:
+            return
+        with self.lock:
+            self._free_slots.append(slot)
+
+    def set_demand_probe(self, probe):
+        """
+        풀 밖에서 대기 중인 요청 수를 알려주는 함수 등록
+        (API 서버의 동시 실행 제한 대기열 등, 오토스케일링 판단에 사용)
+        """
+        self._demand_probe = probe
+
+    def _demand(self):
+        demand = self.waiting
+        if self._demand_probe:
+            try:
+                demand += self._demand_probe()
+            except Exception:
+                pass
+        return demand
+
+    def _recent_wait(self, window=60):
+        """최근 window초 동안 get()에서 가장 오래 기다린 시간"""
+        cutoff = time.time() - window
+        return max((w for t, w in list(self._wait_samples) if t >= cutoff), default=0)
+
+    def _memory_allows_new_driver(self):
+        """가용 메모리가 드라이버 1개 + 여유분보다 많은지 확인 (psutil 없으면 제한 없음)"""
+        try:
+            import psutil
+        except ImportError:
+            return True
+        available_mb = psutil.virtual_memory().available / (1024 * 1024)
+        # 드라이버 1개 분량 + 같은 만큼의 여유를 남겨둠
+        return available_mb >= self.driver_memory_mb * 2
+
+    def _autoscale_loop(self):
+        """대기열/대기 시간에 따라 드라이버를 늘리고, 오래 쉬는 드라이버는 줄임"""
+        while not self._stop_event.wait(self.scale_interval):
+            try:
+                self._autoscale_once()
+            except Exception as e:
+                logger.warning(f"⚠️ 오토스케일링 실패: {e}")
+
+    def _autoscale_once(self):
+        demand = self._demand()
+        recent_wait = self._recent_wait()
+
+        with self.lock:
+            total = self.size + self.creating
+            # 정리 중인 드라이버는 곧 풀로 돌아오므로 그만큼은 증설 사유에서 제외
+            need_more = (
+                (demand > self.recycling and self.pool.qsize() == 0)
+                or recent_wait >= self.scale_up_wait
+            ) and total < self.max_size
+
+        if need_more:
+            if not self._memory_allows_new_driver():
+                logger.warning("⚠️ 가용 메모리 부족 - 드라이버 증설 보류")
+                return
+            with self.lock:
+                self.creating += 1
+            logger.info(f"📈 드라이버 증설 (대기: {demand}, 최근 대기 시간: {recent_wait:.1f}초, 현재: {total}/{self.max_size})")
+            threading.Thread(target=self._grow, name="driver-grow", daemon=True).start()
+            # 증설 판단에 쓴 대기 시간 기록은 초기화 (연속 증설 방지)
+            self._wait_samples.clear()
+            return
+
+        if demand == 0 and self.size > self.min_size:
+            self._retire_idle()
+
+    def _grow(self):
+        try:
+            driver = self._create_ready_driver("추가 드라이버", require_login=True)
+            if driver and self._add_driver(driver):
+                logger.info(f"✅ 드라이버 증설 완료 (현재: {self.size}/{self.max_size})")
+        except Exception as e:
+            logger.error(f"❌ 드라이버 증설 실패: {e}")
+        finally:
+            with self.lock:
+                self.creating -= 1
+
+    def _retire_idle(self):
+        """idle_cooldown 이상 쉬고 있는 드라이버 1개를 종료 (min_size 유지)"""
+        now = time.time()
+        checked = []
+        retired = None
+        try:
+            for _ in range(self.pool.qsize()):
+                try:
+                    driver = self.pool.get_nowait()
+                except Empty:
+                    break
+                idle = now - self._last_used.get(id(driver), now)
+                if retired is None and idle >= self.idle_cooldown and self.size > self.min_size:
+                    retired = driver
+                    self._discard(driver)
+                else:
+                    checked.append(driver)
+        finally:
+            for driver in checked:
+                self.pool.put(driver)
+
+        if retired is not None:
+            self._quit(retired)
+            logger.info(f"📉 유휴 드라이버 종료 (현재: {self.size}/{self.max_size})")
+
+    def _retire_reason(self, driver):
+        """사용 횟수/수명 기준으로 교체가 필요하면 사유 반환 (명령 없이 판단)"""
+        meta = self._meta.get(id(driver))
+        if not meta:
+            return None
+        if self.max_uses and meta["uses"] >= self.max_uses:
+            return f"사용 {meta['uses']}회 도달"
+        if meta["expires"] and time.time() >= meta["expires"]:
+            return f"수명 {time.time() - meta['created']:.0f}초 경과"
+        return None
+
+    def _rss_mb(self, driver):
+        """Chrome 프로세스(하위 프로세스 포함) 메모리 사용량 (psutil 없거나 확인 불가면 None)"""
+        try:
+            import psutil
+        except ImportError:
+            return None
+        pid = getattr(driver, "browser_pid", None)
+        if not pid:
+            return None
+        try:
+            process = psutil.Process(pid)
+            total = process.memory_info().rss
+            for child in process.children(recursive=True):
+                try:
+                    total += child.memory_info().rss
+                except psutil.Error:
+                    pass
+            return total / (1024 * 1024)
+        except psutil.Error:
+            return None
+
+    def _check_health(self, driver):
+        """
+        페이지 이동 없이 유휴 드라이버 상태 확인
+
+        Returns:
+            교체 사유 또는 None (정상)
+        """
+        reason = self._retire_reason(driver)
+        if reason:
+            return reason
+
+        try:
+            if driver.execute_script("return 1") != 1:
+                return "응답 이상"
+        except Exception as e:
+            return f"응답 없음 ({str(e)[:30]})"
+
+        if self.max_rss_mb:
+            rss = self._rss_mb(driver)
+            if rss is not None and rss >= self.max_rss_mb:
+                return f"메모리 {rss:.0f}MB 사용"
+        return None
+
+    def _check_session(self, driver):
+        """
+        로그인 쿠키 상태 확인 (페이지 이동 없음)
+
+        Returns:
+            세션 갱신 사유 또는 None (정상)
+        """
+        from crawler import session_cookie_expiry
+        from session_manager import session_manager
+
+        if self._session_of(driver) < session_manager.generation:
+            return "이전 세션 쿠키 사용 중"
+        try:
+            expiry = session_cookie_expiry(driver.get_cookies())
+        except Exception as e:
+            return f"쿠키 조회 실패 ({str(e)[:30]})"
+        if expiry is None:
+            return "로그인 쿠키 없음"
+        if expiry - time.time() < self.cookie_margin:
+            return "로그인 쿠키 만료 임박"
+        return None
+
+    def _session_of(self, driver):
+        meta = self._meta.get(id(driver))
+        return meta["session"] if meta else 0
+
+    def _ensure_session(self, driver):
+        """
+        드라이버 로그인 세션 복구 (재로그인은 세션 관리자가 풀 전체에서 한 번만 수행)
+
+        Returns:
+            복구 여부
+        """
+        from session_manager import session_manager
+
+        before = session_manager.generation
+        if not session_manager.ensure_login(driver, self._session_of(driver)):
+            return False
+
+        with self.lock:
+            meta = self._meta.get(id(driver))
+            if meta:
+                meta["session"] = session_manager.generation
+        if session_manager.generation > before:
+            # 이 드라이버가 새로 로그인했으면 쉬고 있는 다른 드라이버에도 새 쿠키 전파
+            self._schedule(self._broadcast_session)
+        return True
+
+    def _refresh_session(self, driver, reason):
+        """세션 갱신 후 풀에 반환, 실패 시 교체"""
+        logger.info(f"🔑 드라이버 세션 갱신: {reason}")
+        if self._ensure_session(driver):
+            self._last_used[id(driver)] = time.time()
+            self.pool.put(driver)
+        else:
+            self._replace(driver, f"세션 갱신 실패 ({reason})")
+
+    def _broadcast_session(self):
+        """유휴 드라이버 중 이전 세션 쿠키를 가진 드라이버에 새 쿠키 적용"""
+        from session_manager import session_manager
+
+        seen = set()
+        for _ in range(self.pool.qsize()):
+            try:
+                driver = self.pool.get_nowait()
+            except Empty:
+                break
+            if id(driver) in seen:
+                self.pool.put(driver)
+                break
+            seen.add(id(driver))
+
+            if self._session_of(driver) >= session_manager.generation:
+                self.pool.put(driver)
+                continue
+            if session_manager.apply_cookies(driver):
+                with self.lock:
+                    meta = self._meta.get(id(driver))
+                    if meta:
+                        meta["session"] = session_manager.generation
+                self.pool.put(driver)
+            else:
+                self._replace(driver, "새 세션 쿠키 적용 실패")
+        # 사용 중인 드라이버는 반환될 때(_reset_driver) 새 쿠키를 받음
+
+    def _health_loop(self):
+        """유휴 드라이버를 주기적으로 점검하여 요청이 받기 전에 교체"""
+        while not self._stop_event.wait(self.health_interval):
+            try:
+                self._health_check_once()
+            except Exception as e:
+                logger.warning(f"⚠️ 드라이버 상태 점검 실패: {e}")
+
+    def _reclaim_loop(self):
+        """기한 초과 대여를 주기적으로 회수 (유예 시간보다 짧은 주기로 확인)"""
+        interval = max(1, min(5, self.lease_grace))
+        while not self._stop_event.wait(interval):
+            try:
+                self._reclaim_expired_leases()
+            except Exception as e:
+                logger.warning(f"⚠️ 기한 초과 대여 회수 실패: {e}")
+
+    def _reclaim_expired_leases(self):
+        """기한 + 유예 시간이 지나도 반환되지 않은 대여를 회수하고 드라이버 교체"""
+        now = time.time()
+        with self.lock:
+            expired = [
+                lease for lease in self._leases.values()
+                if lease.deadline is not None and now > lease.deadline + self.lease_grace
+            ]
+            for lease in expired:
+                lease.revoked = True
+                del self._leases[id(lease.driver)]
+
+        for lease in expired:
+            self.reclaimed += 1
+            logger.warning(f"⏱️ 기한 초과 대여 회수 ({now - lease.acquired_at:.0f}초 사용)")
+            # 작업 스레드가 아직 쓰고 있을 수 있으므로 정리 대신 종료 후 교체
+            # (종료되면 작업 스레드의 다음 명령이 즉시 실패하여 빠져나옴)
+            self._schedule(self._replace, lease.driver, "대여 기한 초과")
+
+    def _health_check_once(self):
+        # 한 번에 하나씩 꺼내 점검 후 바로 돌려놓아 요청 대기를 최소화
+        seen = set()
+        for _ in range(self.pool.qsize()):
+            try:
+                driver = self.pool.get_nowait()
+            except Empty:
+                break
+            if id(driver) in seen:
+                self.pool.put(driver)
+                break
+            seen.add(id(driver))
+
+            reason = self._check_health(driver)
+            if reason:
+                self._schedule(self._replace, driver, reason)
+                continue
+            # 세션 문제는 드라이버를 버리지 않고 쿠키 갱신/재로그인으로 복구
+            session_reason = self._check_session(driver)
+            if session_reason:
+                self._schedule(self._refresh_session, driver, session_reason)
+            else:
+                self.pool.put(driver)
+
+    def _schedule(self, fn, driver=None, *args):
+        """
+        드라이버 교체/세션 갱신을 재활용 스레드에 맡김 (호출자는 기다리지 않음)
+        driver를 넘기면 작업이 끝날 때까지 정리 중(recycling)으로 집계
+        """
+        with self.lock:
+            if driver is not None:
+                self.recycling += 1
+            recycler = self._recycler
+        try:
+            if recycler is None:
+                raise RuntimeError("재활용 스레드 없음")
+            if driver is None:
+                recycler.submit(fn)
+            else:
+                self._submit_for(recycler, driver, self._run_counted, fn, driver, *args)
+        except RuntimeError:
+            if driver is None:
+                return
+            # 종료 중이면 교체 없이 종료만
+            with self.lock:
+                self.recycling -= 1
+            self._discard(driver)
+            self._quit(driver)
+
+    def _submit_for(self, recycler, driver, fn, *args):
+        """드라이버 정리 작업 제출 (종료로 작업이 취소되면 풀에 돌려놓지 않고 드라이버 종료)"""
+        future = recycler.submit(fn, *args)
+        future.add_done_callback(lambda f: f.cancelled() and self._drop_cancelled(driver))
+
+    def _drop_cancelled(self, driver):
+        with self.lock:
+            self.recycling -= 1
+        self._discard(driver)
+        self._quit(driver)
+
+    def _run_counted(self, fn, driver, *args):
+        try:
+            fn(driver, *args)
+        finally:
+            with self.lock:
+                self.recycling -= 1
+
+    def _replace(self, driver, reason):
+        """드라이버를 폐기하고 새 드라이버로 교체 (같은 프로필 슬롯을 이어받음)"""
+        logger.info(f"♻️ 드라이버 교체: {reason}")
+        self._discard(driver)
+        self._quit(driver)
+        self.replaced += 1
+
+        try:
+            print("[INFO] 새 드라이버 생성 중...")
+            new_driver = self._create_ready_driver("새 드라이버", require_login=True)
+            if new_driver:
+                if self._add_driver(new_driver):
+                    print("[INFO] 새 드라이버 생성 및 풀에 추가 완료")
+            else:
+                print("[ERROR] 새 드라이버 생성 실패 - 풀 크기 감소")
+        except Exception as e:
+            print(f"[ERROR] 새 드라이버 생성 실패: {e}")
+            import traceback
+            traceback.print_exc()
+
+    def stats(self):
+        """풀 상태 (상태 조회용)"""
+        return {
+            "size": self.size,
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "available": self.pool.qsize(),
+            "waiting": self.waiting,
+            "creating": self.creating,
+            "recycling": self.recycling,
+            "replaced": self.replaced,
+            "leased": len(self._leases),
+            "reclaimed": self.reclaimed,
+            "profiles": self.profile_root
+        }
+
+    def _create_ready_driver(self, name, require_login=True):
+        """
+        드라이버 생성 → 쿠키 로그인 → 메인 페이지 준비까지 완료된 드라이버 반환
+
+        Args:
+            name: 로그 출력용 이름
+            require_login: True면 로그인 실패 시 드라이버를 폐기하고 None 반환
+
+        Returns:
+            driver 또는 None
+        """
+        from crawler import create_undetected_driver, load_cookies, verify_login_status
+        from session_manager import session_manager
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        # 이 드라이버가 쿠키를 읽기 전의 세션 세대 (그 뒤 다른 드라이버가 재로그인했는지 판단용)
+        known_generation = session_manager.generation
+
+        slot, profile_dir = self._take_profile()
+        try:
+            driver = create_undetected_driver(user_data_dir=profile_dir)
+        except Exception:
+            self._release_slot(slot)
+            raise
+        if not driver:
+            self._release_slot(slot)
+            print(f"[ERROR] {name} 생성 실패")
+            return None
+        if slot is not None:
+            with self.lock:
+                self._slot_of[id(driver)] = slot
+
+        try:
+            logged_in = False
+            cookie_loaded = False
+
+            if profile_dir:
+                # 유지된 프로필이면 이미 로그인되어 있을 수 있으므로 쿠키 주입 없이 먼저 확인
+                driver.get(BLOGDEX_HOME)
+                WebDriverWait(driver, 10).until(
+                    lambda d: d.execute_script("return document.readyState") == "complete"
+                )
+                if verify_login_status(driver):
+                    logged_in = True
+                    print(f"[INFO] {name} 프로필 로그인 유지 (slot_{slot})")
+
+            if not logged_in:
+                # 쿠키 로드 (load_cookies가 BlogDex 접속까지 수행)
+                cookie_loaded = load_cookies(driver, "cookies.pkl")
+
+            if cookie_loaded:
+                driver.refresh()
+                WebDriverWait(driver, 10).until(
+                    lambda d: d.execute_script("return document.readyState") == "complete"
+                )
+
+                if verify_login_status(driver):
+                    logged_in = True
+                    print(f"[INFO] {name} 쿠키 로그인 성공")
+
+            if not logged_in and require_login:
+                # 저장된 쿠키가 만료된 경우 풀 전체에서 한 번만 재로그인 (이미 다른 드라이버가 했으면 쿠키만 적용)
+                if session_manager.ensure_login(driver, known_generation):
+                    logged_in = True
+                    print(f"[INFO] {name} 세션 복구 완료")
+                    # 새 세션이면 쉬고 있는 다른 드라이버에도 전파 (이미 최신인 드라이버는 건너뜀)
+                    self._schedule(self._broadcast_session)
+
+            if not logged_in:
+                if require_login:
+                    print(f"[WARNING] {name} 로그인 실패 - 인증되지 않은 드라이버는 풀에 추가하지 않음")
+                    self._quit(driver)
+                    return None
+                print(f"[WARNING] {name} 로그인 필요 - 수동 로그인 후 재시작 필요")
+
+            # 메인 페이지로 이동 및 URL 입력 필드 대기 (프로필 확인 단계에서 이미 메인이면 생략)
+            if driver.current_url.rstrip("/") != BLOGDEX_HOME.rstrip("/"):
+                driver.get(BLOGDEX_HOME)
+            self._wait_for_input(driver, name)
+            return driver
+
+        except Exception:
+            self._quit(driver)
+            raise
+
+    def _wait_for_input(self, driver, name):
+        """메인 페이지의 URL 입력 필드가 준비될 때까지 대기 (없으면 body로 대체)"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
+        for selector in URL_INPUT_SELECTORS:
+            try:
+                element = WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+                )
+                if element.is_displayed() and element.is_enabled():
+                    logger.info(f"✅ {name}: URL 입력 필드 준비 완료")
+                    return True
+            except:
+                continue
+
+        logger.warning(f"⚠️ {name}: URL 입력 필드 대기 타임아웃 (fallback to body)")
+        WebDriverWait(driver, 5).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        return False
 
     def get(self, timeout=30):
         """
@@ -113,64 +813,131 @@ class DriverPool:
         if not self.initialized:
             raise RuntimeError("드라이버 풀이 초기화되지 않았습니다. initialize()를 먼저 호출하세요.")
 
+        start = time.time()
+        with self.lock:
+            self.waiting += 1
         try:
-            driver = self.pool.get(timeout=timeout)
-            print(f"[INFO] 드라이버 풀에서 가져옴 (남은 개수: {self.pool.qsize()}/{self.size})")
-            return driver
+            while True:
+                driver = self.pool.get(timeout=max(0, timeout - (time.time() - start)))
+                # 교체 기준에 도달한 드라이버는 내주지 않고 백그라운드에서 교체
+                reason = self._retire_reason(driver)
+                if reason:
+                    self._schedule(self._replace, driver, reason)
+                    continue
+                with self.lock:
+                    meta = self._meta.get(id(driver))
+                    if meta:
+                        meta["uses"] += 1
+                print(f"[INFO] 드라이버 풀에서 가져옴 (남은 개수: {self.pool.qsize()}/{self.size})")
+                return driver
         except Empty:
             raise TimeoutError(f"드라이버 풀에서 드라이버를 가져오는 데 {timeout}초 동안 실패했습니다")
+        finally:
+            with self.lock:
+                self.waiting -= 1
+            # 오토스케일링 판단용 대기 시간 기록
+            self._wait_samples.append((time.time(), time.time() - start))
+
+    def acquire(self, timeout=30, deadline=None) -> DriverLease:
+        """
+        기한이 있는 드라이버 대여
+
+        Args:
+            timeout: 드라이버 대기 시간 (초)
+            deadline: 작업 마감 시각 (epoch 초, None이면 기한 없음)
+                      마감 + lease_grace가 지나도 반환되지 않으면 풀이 드라이버를 회수
+
+        Raises:
+            LeaseExpired: 드라이버를 받기 전에 이미 마감이 지난 경우
+            TimeoutError: 타임아웃 시
+        """
+        if deadline is not None:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise LeaseExpired("드라이버를 받기 전에 작업 기한이 지났습니다")
+            timeout = min(timeout, remaining)
+
+        driver = self.get(timeout=timeout)
+        lease = DriverLease(self, driver, deadline)
+        with self.lock:
+            self._leases[id(driver)] = lease
+        return lease
+
+    def release(self, lease: DriverLease):
+        """대여 반환 (이미 회수된 대여면 아무것도 하지 않음)"""
+        with self.lock:
+            if lease.released or lease.revoked:
+                lease.released = True
+                return
+            lease.released = True
+            self._leases.pop(id(lease.driver), None)
+        self.put(lease.driver)
 
     def put(self, driver):
         """
         드라이버를 풀에 반환
+        정리(메인 이동, 로그인 확인, 손상 시 재생성)는 백그라운드 재활용 스레드가 처리하므로
+        호출자는 기다리지 않음. 정리가 끝난 드라이버만 다시 풀에 들어감
 
         Args:
             driver: 반환할 드라이버
         """
+        with self.lock:
+            self.recycling += 1
+            recycler = self._recycler
+        try:
+            if recycler is None:
+                raise RuntimeError("재활용 스레드 없음")
+            self._submit_for(recycler, driver, self._recycle, driver)
+        except RuntimeError:
+            # 초기화 전/종료 중에는 호출 스레드에서 바로 처리
+            self._recycle(driver)
+
+    def _recycle(self, driver):
+        """드라이버 정리 후 풀에 반환 (손상 시 새 드라이버로 교체)"""
+        try:
+            self._reset_driver(driver)
+        finally:
+            with self.lock:
+                self.recycling -= 1
+
+    def _reset_driver(self, driver):
+        """메인 페이지 이동 및 로그인 확인 후 풀에 반환, 실패 시 폐기하고 새로 생성"""
+        reason = self._retire_reason(driver)
+        if reason:
+            # 어차피 교체할 드라이버는 정리하지 않고 바로 교체
+            self._replace(driver, reason)
+            return
+
         try:
             # 드라이버 상태 확인
             driver.current_url  # 연결 확인용
 
+            # 탭 공유 모드에서 추가로 연 탭 정리 (첫 탭만 유지)
+            handles = driver.window_handles
+            if len(handles) > 1:
+                for handle in handles[1:]:
+                    driver.switch_to.window(handle)
+                    driver.close()
+                driver.switch_to.window(handles[0])
+
             # 메인 페이지로 이동 (다음 사용을 위해)
             try:
-                driver.get("https://blogdex.space/")
-                from selenium.webdriver.common.by import By
-                from selenium.webdriver.support.ui import WebDriverWait
-                from selenium.webdriver.support import expected_conditions as EC
-
-                # 🔥 Phase 4: 메인 검색 필드만 정확히 타겟팅 (디버그 스크립트 결과 기반)
-                url_input_selectors = [
-                    "input[placeholder='블로그 주소/아이디를 입력하세요.']",
-                    "input.h-14[type='text']",
-                    "input[type='text'][placeholder*='블로그 주소/아이디']",
-                    "main section input[type='text']"
-                ]
-
-                input_found = False
-                for selector in url_input_selectors:
-                    try:
-                        element = WebDriverWait(driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                        )
-                        if element.is_displayed() and element.is_enabled():
-                            input_found = True
-                            logger.info(f"✅ 드라이버 풀 반환: 페이지 준비 완료")
-                            break
-                    except:
-                        continue
-
-                if not input_found:
-                    logger.warning(f"⚠️ 드라이버 풀 반환: URL 입력 필드 대기 타임아웃 (fallback to body)")
-                    # Fallback: body 태그만이라도 확인
-                    WebDriverWait(driver, 5).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "body"))
-                    )
+                driver.get(BLOGDEX_HOME)
+                self._wait_for_input(driver, "드라이버 풀 반환")
 
                 # 🔥 Codex 제안: 드라이버 반환 전 로그인 상태 확인 (필수!)
+                # 다른 드라이버가 재로그인한 뒤라면 새 쿠키부터 적용
                 from crawler import verify_login_status
-                if not verify_login_status(driver):
-                    logger.error("❌ 드라이버 풀 반환: 로그인 세션 만료 감지 - 드라이버 폐기")
-                    raise Exception("로그인 세션 만료")
+                from session_manager import session_manager
+                stale = self._session_of(driver) < session_manager.generation
+                if stale or not verify_login_status(driver):
+                    logger.warning("⚠️ 드라이버 풀 반환: 로그인 세션 갱신 필요")
+                    if not self._ensure_session(driver):
+                        logger.error("❌ 드라이버 풀 반환: 로그인 세션 복구 실패 - 드라이버 폐기")
+                        raise Exception("로그인 세션 만료")
+                    driver.get(BLOGDEX_HOME)
+                    self._wait_for_input(driver, "드라이버 풀 반환")
 
                 logger.info("✅ 드라이버 풀 반환: 로그인 상태 정상")
 
@@ -179,103 +946,36 @@ class DriverPool:
                 # 로그인 세션 만료 시 드라이버 손상으로 처리 (재생성 트리거)
                 raise Exception(f"드라이버 반환 실패: {str(e)[:30]}")
 
+            self._last_used[id(driver)] = time.time()
             self.pool.put(driver)
             logger.info(f"✅ 드라이버 풀에 반환 (현재 개수: {self.pool.qsize()}/{self.size})")
 
         except Exception as e:
             print(f"[ERROR] 드라이버 손상 감지: {e}")
             # 손상된 드라이버는 정리하고 새로 생성
-            try:
-                driver.quit()
-            except:
-                pass
-
-            # 새 드라이버 생성 시도
-            try:
-                print("[INFO] 새 드라이버 생성 중...")
-                from crawler import create_undetected_driver, load_cookies, verify_login_status
-                from selenium.webdriver.common.by import By
-                from selenium.webdriver.support.ui import WebDriverWait
-                from selenium.webdriver.support import expected_conditions as EC
-
-                new_driver = create_undetected_driver()
-
-                if new_driver:
-                    # 🔥 중요: BlogDex 접속 및 쿠키 로그인
-                    new_driver.get("https://blogdex.space/")
-                    WebDriverWait(new_driver, 5).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "body"))
-                    )
-
-                    # 쿠키 로드 및 로그인 확인
-                    cookie_loaded = load_cookies(new_driver, "cookies.pkl")
-                    logged_in = False
-
-                    if cookie_loaded:
-                        new_driver.refresh()
-                        time.sleep(1)
-
-                        if verify_login_status(new_driver):
-                            logged_in = True
-                            print(f"[INFO] 새 드라이버 쿠키 로그인 성공")
-                            time.sleep(2)  # 페이지 안정화
-
-                    if not logged_in:
-                        print("[WARNING] 새 드라이버 로그인 실패 - 인증되지 않은 드라이버는 풀에 추가하지 않음")
-                        new_driver.quit()
-                        print("[ERROR] 새 드라이버 폐기 - 풀 크기 감소")
-                        return
-
-                    # 메인 페이지로 이동 및 URL 입력 필드 대기
-                    new_driver.get("https://blogdex.space/")
-
-                    # 🔥 Phase 4: 메인 검색 필드만 정확히 타겟팅 (디버그 스크립트 결과 기반)
-                    url_input_selectors = [
-                        "input[placeholder='블로그 주소/아이디를 입력하세요.']",
-                        "input.h-14[type='text']",
-                        "input[type='text'][placeholder*='블로그 주소/아이디']",
-                        "main section input[type='text']"
-                    ]
-                    input_found = False
-                    for selector in url_input_selectors:
-                        try:
-                            element = WebDriverWait(new_driver, 10).until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                            )
-                            if element.is_displayed() and element.is_enabled():
-                                input_found = True
-                                logger.info(f"✅ 새 드라이버: URL 입력 필드 준비 완료")
-                                break
-                        except:
-                            continue
-
-                    if not input_found:
-                        logger.warning("⚠️ 새 드라이버: URL 입력 필드 대기 타임아웃 (fallback to body)")
-                        # Fallback
-                        WebDriverWait(new_driver, 5).until(
-                            EC.presence_of_element_located((By.TAG_NAME, "body"))
-                        )
-
-                    self.pool.put(new_driver)
-                    print("[INFO] 새 드라이버 생성 및 풀에 추가 완료")
-                else:
-                    print("[ERROR] 새 드라이버 생성 실패 - 풀 크기 감소")
-            except Exception as e2:
-                print(f"[ERROR] 새 드라이버 생성 실패: {e2}")
-                import traceback
-                traceback.print_exc()
+            self._replace(driver, "손상")
 
     def cleanup(self):
         """
         서버 종료 시 모든 드라이버 정리
         """
         print("[INFO] 드라이버 풀 정리 시작...")
+        # 아직 준비 중인 드라이버는 완료 즉시 종료되도록 표시
+        self.closing = True
+        self._stop_event.set()
+        with self.lock:
+            recycler, self._recycler = self._recycler, None
+        if recycler is not None:
+            # 대기 중인 정리 작업은 취소하고 그 드라이버는 바로 종료 (_submit_for 콜백),
+            # 실행 중인 작업은 끝날 때까지 기다려 풀에 돌아온 드라이버까지 아래에서 정리
+            recycler.shutdown(wait=True, cancel_futures=True)
 
         cleaned = 0
         while not self.pool.empty():
             try:
                 driver = self.pool.get_nowait()
-                driver.quit()
+                self._discard(driver)
+                self._quit(driver)
                 cleaned += 1
                 print(f"[INFO] 드라이버 {cleaned} 정리 완료")
             except Exception as e:
@@ -286,4 +986,18 @@ class DriverPool:
 
 
 # 글로벌 드라이버 풀 인스턴스
-driver_pool = DriverPool(size=3)
+_min_size = int(os.getenv("DRIVER_POOL_MIN", 3))
+driver_pool = DriverPool(
+    min_size=_min_size,
+    max_size=int(os.getenv("DRIVER_POOL_MAX", max(_min_size, min(8, os.cpu_count() or _min_size)))),
+    warmup_parallelism=int(os.getenv("DRIVER_WARMUP_PARALLELISM", _min_size)),
+    idle_cooldown=int(os.getenv("DRIVER_IDLE_COOLDOWN", 300)),
+    driver_memory_mb=int(os.getenv("DRIVER_MEMORY_MB", 500)),
+    recycle_workers=int(os.getenv("DRIVER_RECYCLE_WORKERS", 2)),
+    profile_root=os.getenv("CHROME_PROFILE_ROOT", "chrome_profiles") or None,
+    health_interval=int(os.getenv("DRIVER_HEALTH_INTERVAL", 30)),
+    max_uses=int(os.getenv("DRIVER_MAX_USES", 200)),
+    max_age=int(os.getenv("DRIVER_MAX_AGE_MIN", 60)) * 60,
+    max_rss_mb=int(os.getenv("DRIVER_MAX_RSS_MB", 1500)),
+    lease_grace=int(os.getenv("DRIVER_LEASE_GRACE", 15))
+)
@@ -0,0 +1,236 @@
+"""
+저장된 크롤링 결과 내보내기 (Parquet / Arrow / CSV)
+
+data/results.db의 결과를 분석용 파일로 내보냄 (JSON 파일 수천 개를 모을 필요 없음)
+- 결과를 묶음 단위로 읽어 바로 기록하므로 행 수와 관계없이 메모리 사용량 일정
+- Parquet / Arrow: 등급/레벨/티어 등 반복 값은 사전(dictionary) 인코딩, 시각은 timestamp 타입
+  (pyarrow 필요 - 선택사항, 없으면 CSV만 사용 가능)
+- API 서버의 GET /api/export도 같은 함수로 스트리밍
+
+사용법:
+    python export_results.py --format csv --output results.csv
+    python export_results.py --format parquet --output results.parquet --start 2025-11-01 --end 2025-11-30
+    python export_results.py --format arrow --output elite.arrows --tier "Elite Blogger" --success true
+
+환경 변수:
+    RESULT_DB_PATH: 결과 데이터베이스 경로 (기본: data/results.db)
+"""
+
+import argparse
+import csv
+import io
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+from sqlite_store import SQLiteResultStore, result_db
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# 내보낼 컬럼 (enrich_result 스키마, 원본 응답 raw 제외)
+EXPORT_COLUMNS = [
+    "blog_id", "url", "grade", "level", "level_en", "tier", "tier_en",
+    "tier_rank", "success", "error", "timestamp"
+]
+
+# 반복 값이 많은 문자열 컬럼 (사전 인코딩)
+DICTIONARY_COLUMNS = ["blog_id", "grade", "level", "level_en", "tier", "tier_en", "error"]
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+}
+
+
+def arrow_available() -> bool:
+    return pa is not None
+
+
+def arrow_schema():
+    """내보내기용 Arrow 스키마"""
+    fields = []
+    for column in EXPORT_COLUMNS:
+        if column in DICTIONARY_COLUMNS:
+            field_type = pa.dictionary(pa.int32(), pa.string())
+        elif column == "tier_rank":
+            field_type = pa.int8()
+        elif column == "success":
+            field_type = pa.bool_()
+        elif column == "timestamp":
+            field_type = pa.timestamp("s")
+        else:
+            field_type = pa.string()
+        fields.append(pa.field(column, field_type, nullable=column not in ("blog_id", "success", "timestamp")))
+    return pa.schema(fields)
+
+
+def _to_record_batch(rows, schema):
+    columns = []
+    for field in schema:
+        values = [row[field.name] for row in rows]
+        if field.name == "timestamp":
+            values = [datetime.fromisoformat(value) for value in values]
+        columns.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+class _ChunkSink:
+    """pyarrow 기록 대상 (기록된 바이트를 모아두었다가 묶음마다 꺼냄)"""
+
+    def __init__(self):
+        self.chunks = []
+        self.closed = False
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def _iter_csv(batches) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for rows in batches:
+        for row in rows:
+            writer.writerow([row[column] for column in EXPORT_COLUMNS])
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    # 결과가 없어도 헤더는 기록
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _iter_arrow(batches, fmt: str) -> Iterator[bytes]:
+    schema = arrow_schema()
+    sink = _ChunkSink()
+    output = pa.PythonFile(sink, mode="w")
+    if fmt == "parquet":
+        writer = pq.ParquetWriter(output, schema, compression="zstd")
+    else:
+        # 파일 형식은 묶음마다 달라지는 사전을 허용하지 않으므로 스트림 형식 사용 (pyarrow.ipc.open_stream으로 읽기)
+        writer = pa_ipc.new_stream(output, schema)
+
+    # 묶음마다 Parquet row group / Arrow record batch 1개
+    for rows in batches:
+        batch = _to_record_batch(rows, schema)
+        if fmt == "parquet":
+            writer.write_table(pa.Table.from_batches([batch], schema=schema))
+        else:
+            writer.write_batch(batch)
+        data = sink.drain()
+        if data:
+            yield data
+
+    writer.close()
+    yield sink.drain()
+
+
+def iter_export(fmt: str = "csv", store: SQLiteResultStore = result_db,
+                start: Optional[str] = None, end: Optional[str] = None,
+                tier: Optional[str] = None, success: Optional[bool] = None,
+                batch_size: int = 50000) -> Iterator[bytes]:
+    """
+    조건에 맞는 결과를 지정 형식의 바이트 조각으로 순서대로 반환
+
+    Args:
+        fmt: "csv", "parquet", "arrow"
+        store: 결과 저장소
+        start / end: 조회 구간 ('YYYY-MM-DD' 또는 'YYYY-MM-DD HH:MM:SS', end 포함)
+        tier: 티어 (한글 또는 영문, 예: "엘리트 블로거", "Elite Blogger")
+        success: 성공/실패 결과만 (None이면 전체)
+        batch_size: 한 번에 읽어 기록할 행 수 (Parquet row group 크기)
+
+    Raises:
+        ValueError: 지원하지 않는 형식이거나 pyarrow가 없는 경우
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 형식: {fmt} (csv, parquet, arrow)")
+    if fmt != "csv" and not arrow_available():
+        raise ValueError(f"{fmt} 형식은 pyarrow가 필요합니다 (pip install pyarrow)")
+
+    batches = store.iter_rows(start=start, end=end, tier=tier, success=success, batch_size=batch_size)
+    if fmt == "csv":
+        return _iter_csv(batches)
+    return _iter_arrow(batches, fmt)
+
+
+def export_to_file(path: str, fmt: str = "csv", store: SQLiteResultStore = result_db, **filters) -> int:
+    """
+    결과를 파일로 내보내기
+
+    Returns:
+        기록한 바이트 수
+    """
+    # 형식/pyarrow 확인을 먼저 해서 실패 시 빈 파일을 만들지 않음
+    chunks = iter_export(fmt, store, **filters)
+    written = 0
+    with open(path, "wb") as f:
+        for chunk in chunks:
+            f.write(chunk)
+            written += len(chunk)
+    return written
+
+
+def _parse_bool(value: str) -> bool:
+    if value.lower() in ("true", "1", "yes"):
+        return True
+    if value.lower() in ("false", "0", "no"):
+        return False
+    raise argparse.ArgumentTypeError(f"true 또는 false: {value}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="저장된 크롤링 결과를 Parquet / Arrow / CSV로 내보내기")
+    parser.add_argument("--format", choices=list(EXPORT_FORMATS), default="csv", help="출력 형식")
+    parser.add_argument("--output", default=None, help="출력 파일 (기본: data/exports/results_<시각>.<확장자>)")
+    parser.add_argument("--db", default=result_db.db_path, help="결과 데이터베이스 경로")
+    parser.add_argument("--start", default=None, help="시작 시각 (YYYY-MM-DD 또는 YYYY-MM-DD HH:MM:SS)")
+    parser.add_argument("--end", default=None, help="종료 시각 (포함)")
+    parser.add_argument("--tier", default=None, help="티어 (예: \"Elite Blogger\")")
+    parser.add_argument("--success", type=_parse_bool, default=None, help="true: 성공만, false: 실패만")
+    parser.add_argument("--batch-size", type=int, default=50000, help="한 번에 기록할 행 수")
+    args = parser.parse_args()
+
+    output = args.output
+    if output is None:
+        Path("data/exports").mkdir(parents=True, exist_ok=True)
+        output = f"data/exports/results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{EXPORT_FORMATS[args.format][1]}"
+
+    try:
+        written = export_to_file(
+            output,
+            args.format,
+            SQLiteResultStore(db_path=args.db),
+            start=args.start,
+            end=args.end,
+            tier=args.tier,
+            success=args.success,
+            batch_size=max(1, args.batch_size)
+        )
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+
+    print(f"✅ 내보내기 완료: {output} ({written / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+브라우저 없이 BlogDex 등급 API를 직접 호출하는 HTTP 클라이언트
+드라이버가 로그인하며 저장한 cookies.pkl의 세션 쿠키를 재사용
+(Cloudflare 챌린지/세션 만료 시에는 None을 반환하여 Chrome 크롤링으로 폴백)
+"""
+
+from pathlib import Path
+from urllib.parse import quote, unquote, urlparse
+import os
+import pickle
+import threading
+import logging
+from typing import Dict, Optional
+
+from result_store import build_blog_id, find_grade_in_payload, url_refers_to_blog
+
+logger = logging.getLogger(__name__)
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401 - HTTP/2 지원 여부 확인용
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# User-Agent의 Chrome 버전은 드라이버와 같은 감지 결과(chromedriver_cache)로 채움
+USER_AGENT_TEMPLATE = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/{version}.0.0.0 Safari/537.36"
+)
+
+DEFAULT_HEADERS = {
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Referer": "https://blogdex.space/",
+    "Origin": "https://blogdex.space"
+}
+
+
+def build_headers() -> Dict[str, str]:
+    """설치된 Chrome 주 버전을 User-Agent에 넣은 요청 헤더"""
+    from chromedriver_cache import chromedriver_cache
+
+    headers = dict(DEFAULT_HEADERS)
+    headers["User-Agent"] = USER_AGENT_TEMPLATE.format(version=chromedriver_cache.version_main)
+    return headers
+
+
+class BlogdexHttpClient:
+    """세션 쿠키를 공유하는 keep-alive HTTP 클라이언트"""
+
+    def __init__(self, endpoint_template=None, cookie_path="cookies.pkl", timeout=10):
+        """
+        Args:
+            endpoint_template: 등급 API URL 템플릿 ({blog_id}, {url} 치환)
+                               None이면 네트워크 수집 모드에서 학습한 URL 사용
+            cookie_path: 세션 쿠키 파일 경로
+            timeout: 요청 타임아웃 (초)
+        """
+        self.endpoint_template = endpoint_template
+        self.cookie_path = cookie_path
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self._client = None
+        self._cookie_mtime = None
+
+    @property
+    def available(self) -> bool:
+        """httpx 설치 및 API URL 확보 여부"""
+        return httpx is not None and bool(self.endpoint_template)
+
+    def learn_endpoint(self, source_url: str, blog_url: str):
+        """
+        네트워크 수집 모드에서 등급이 담긴 응답 URL로 API 템플릿 학습
+        (경로 구간이나 쿼리 값이 블로그 ID/블로그 URL과 정확히 같은 경우에만, 호스트 등 다른 부분은 그대로 유지)
+        """
+        if self.endpoint_template or not source_url:
+            return
+
+        blog_id = build_blog_id(blog_url)
+        parsed = urlparse(source_url)
+        replaced = False
+
+        params = []
+        for param in parsed.query.split('&') if parsed.query else []:
+            key, sep, value = param.partition('=')
+            if sep and unquote(value) == blog_id:
+                param, replaced = f"{key}={{blog_id}}", True
+            elif sep and unquote(value) == blog_url:
+                param, replaced = f"{key}={{url}}", True
+            params.append(param)
+
+        segments = parsed.path.split('/')
+        if not replaced:
+            # 쿼리에 없으면 경로에서 마지막으로 일치하는 구간 1개만 치환 (/api/... 같은 고정 경로와 ID가 같은 경우 대비)
+            for i in range(len(segments) - 1, -1, -1):
+                if segments[i] == blog_id:
+                    segments[i], replaced = "{blog_id}", True
+                    break
+                if segments[i] and unquote(segments[i]) == blog_url:
+                    segments[i], replaced = "{url}", True
+                    break
+
+        if not replaced:
+            return
+
+        template = f"{parsed.scheme}://{parsed.netloc}{'/'.join(segments)}"
+        if params:
+            template += "?" + "&".join(params)
+        self.endpoint_template = template
+        logger.info(f"✅ 등급 API URL 학습: {template}")
+
+    def reload_cookies(self):
+        """쿠키 파일을 다시 읽도록 표시 (세션 갱신 시 호출)"""
+        with self.lock:
+            self._cookie_mtime = None
+
+    def _get_client(self):
+        """클라이언트 생성 및 쿠키 파일이 바뀌었으면 쿠키 갱신"""
+        with self.lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    http2=HTTP2_AVAILABLE,
+                    timeout=self.timeout,
+                    headers=build_headers(),
+                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+                    follow_redirects=False
+                )
+
+            cookie_file = Path(self.cookie_path)
+            if cookie_file.exists():
+                mtime = cookie_file.stat().st_mtime
+                if mtime != self._cookie_mtime:
+                    with open(cookie_file, 'rb') as f:
+                        cookies = pickle.load(f)
+                    self._client.cookies.clear()
+                    for cookie in cookies:
+                        self._client.cookies.set(
+                            cookie.get("name"),
+                            cookie.get("value"),
+                            domain=cookie.get("domain", ""),
+                            path=cookie.get("path", "/")
+                        )
+                    self._cookie_mtime = mtime
+                    logger.info(f"🍪 HTTP 클라이언트 쿠키 로드 ({len(cookies)}개)")
+
+            return self._client
+
+    def fetch_grade(self, blog_url: str, timeout: Optional[float] = None) -> Optional[Dict]:
+        """
+        등급 API 직접 호출
+
+        Args:
+            blog_url: 블로그 URL
+            timeout: 요청 타임아웃 (초, 기본: 클라이언트 타임아웃)
+
+        Returns:
+            {"grade": 등급, "raw": 응답 JSON} 또는 None (폴백 필요)
+        """
+        if not self.available:
+            return None
+
+        api_url = (
+            self.endpoint_template
+            .replace("{blog_id}", build_blog_id(blog_url))
+            .replace("{url}", quote(blog_url, safe=""))
+        )
+
+        try:
+            response = self._get_client().get(api_url, timeout=timeout or self.timeout)
+        except Exception as e:
+            logger.warning(f"⚠️ HTTP 등급 조회 실패: {str(e)[:80]}")
+            return None
+
+        if response.status_code in (401, 302, 307):
+            logger.warning("⚠️ HTTP 등급 조회: 세션 만료 - 브라우저로 폴백")
+            return None
+        if response.status_code in (403, 503) or "cf-mitigated" in response.headers:
+            logger.warning(f"⚠️ HTTP 등급 조회: Cloudflare 챌린지 감지 ({response.status_code}) - 브라우저로 폴백")
+            return None
+        if response.status_code != 200:
+            logger.warning(f"⚠️ HTTP 등급 조회: 예상하지 못한 응답 ({response.status_code})")
+            return None
+
+        try:
+            payload = response.json()
+        except ValueError:
+            logger.warning("⚠️ HTTP 등급 조회: JSON 응답 아님 - 브라우저로 폴백")
+            return None
+
+        blog_id = build_blog_id(blog_url)
+        grade = find_grade_in_payload(payload, blog_id, scoped=url_refers_to_blog(api_url, blog_id))
+        if not grade:
+            return None
+        return {"grade": grade, "raw": payload}
+
+    def close(self):
+        with self.lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+
+# 글로벌 HTTP 클라이언트 인스턴스
+blogdex_http = BlogdexHttpClient(endpoint_template=os.getenv("BLOGDEX_GRADE_API_URL"))
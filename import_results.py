@@ -0,0 +1,249 @@
+"""
+data/json_results 일괄 가져오기 (JSON 파일 → SQLite 결과 저장소)
+
+크롤링마다 쌓인 *_grade_*.json 파일을 읽어 data/results.db로 옮기고, 원본은 선택적으로 보관 디렉터리로 이동
+- 디렉터리를 순차로 읽고 파일을 묶음 단위로 처리하므로 파일 수와 관계없이 메모리 사용량 일정
+- 파싱/정규화는 CPU 코어 수만큼의 프로세스에서 병렬 처리, 쓰기는 메인 프로세스에서 묶음 트랜잭션으로 처리
+- 가져온 파일 이름을 결과와 같은 트랜잭션에 기록하므로 중단 후 다시 실행하면 남은 파일부터 이어서 처리
+- 두 스키마 모두 지원
+  - 현재: persist_result / enrich_result (url, blog_id, success, error 포함)
+  - 이전: blogdex_selenium_login.py의 save_result_json (blog_url만 있고 success 없음)
+
+사용법:
+    python import_results.py
+    python import_results.py --source data/json_results --archive data/json_archive
+    python import_results.py --workers 8 --batch-size 2000
+
+환경 변수:
+    RESULT_DB_PATH: 결과 데이터베이스 경로 (기본: data/results.db)
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from result_store import build_blog_id, get_level_info, GRADE_MAPPING
+from sqlite_store import SQLiteResultStore, result_db
+
+FILE_PATTERN = "*_grade_*.json"
+FILENAME_TIME = re.compile(r"_grade_(\d{8})_(\d{6})")
+LEVEL_KEYS = ["level", "level_en", "tier", "tier_en", "tier_rank"]
+
+
+def iter_result_files(source_dir: str) -> Iterator[str]:
+    """결과 파일 이름을 디렉터리 순서대로 하나씩 반환 (목록 전체를 만들지 않음)"""
+    with os.scandir(source_dir) as entries:
+        for entry in entries:
+            if entry.is_file() and fnmatch(entry.name, FILE_PATTERN):
+                yield entry.name
+
+
+def iter_batches(names: Iterator[str], batch_size: int) -> Iterator[List[str]]:
+    batch = []
+    for name in names:
+        batch.append(name)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _timestamp_from_name(name: str) -> Optional[str]:
+    match = FILENAME_TIME.search(name)
+    if not match:
+        return None
+    try:
+        parsed = datetime.strptime(f"{match.group(1)}{match.group(2)}", "%Y%m%d%H%M%S")
+    except ValueError:
+        return None
+    return parsed.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def normalize_result(data: Dict, name: str) -> Optional[Dict]:
+    """
+    두 가지 JSON 스키마를 enrich_result 형식으로 정규화
+
+    Args:
+        data: JSON 파일 내용
+        name: 파일 이름 (timestamp가 없을 때 사용)
+
+    Returns:
+        정규화된 결과 또는 None (URL이 없는 경우)
+    """
+    url = data.get("url") or data.get("blog_url")
+    if not url:
+        return None
+
+    grade = data.get("grade")
+    error = data.get("error")
+    if "success" in data:
+        success = bool(data["success"])
+    else:
+        # 이전 스키마는 등급을 찾은 경우에만 저장
+        success = grade is not None
+
+    # 등급 매핑에 없는 값(예: 페이지 라벨 "블로그지수")은 실패로 저장 (최근 등급/이력에 나타나지 않도록)
+    if grade is not None and grade not in GRADE_MAPPING:
+        error = f"알 수 없는 등급: {grade}"
+        grade = None
+        success = False
+
+    result = {
+        "url": url,
+        # 이전 스키마 파일 이름의 blog_id(naver)는 쓰지 않고 URL에서 다시 추출
+        "blog_id": data.get("blog_id") or build_blog_id(url),
+        "grade": grade,
+        "timestamp": data.get("timestamp") or _timestamp_from_name(name),
+        "success": success,
+        "error": error
+    }
+    for key in LEVEL_KEYS:
+        result[key] = data.get(key) if success else None
+
+    # 레벨 정보가 빠진 성공 결과는 등급 매핑으로 보충
+    if success and grade and result["tier"] is None:
+        level_info = get_level_info(grade)
+        if level_info:
+            result.update(level_info)
+
+    if not result["timestamp"]:
+        return None
+    return result
+
+
+def load_batch(source_dir: str, names: List[str]):
+    """
+    파일 묶음 읽기 + 정규화 (작업 프로세스에서 실행)
+
+    Returns:
+        (정규화된 결과 목록, [(파일 이름, "ok" 또는 "error")])
+    """
+    results, files = [], []
+    for name in names:
+        try:
+            with open(os.path.join(source_dir, name), 'r', encoding='utf-8') as f:
+                result = normalize_result(json.load(f), name)
+        except (OSError, ValueError, AttributeError):
+            result = None
+
+        if result is None:
+            files.append((name, "error"))
+        else:
+            results.append(result)
+            files.append((name, "ok"))
+    return results, files
+
+
+def archive_files(source_dir: str, archive_dir: str, names: List[str]):
+    """가져온 원본 파일을 보관 디렉터리로 이동"""
+    for name in names:
+        try:
+            shutil.move(os.path.join(source_dir, name), os.path.join(archive_dir, name))
+        except OSError as e:
+            print(f"⚠️ 보관 이동 실패: {name} ({e})")
+
+
+def import_directory(source_dir: str, store: SQLiteResultStore, workers: Optional[int] = None,
+                     batch_size: int = 1000, archive_dir: Optional[str] = None) -> Dict:
+    """
+    디렉터리의 결과 파일을 저장소로 가져오기
+
+    Args:
+        source_dir: JSON 결과 디렉터리
+        store: 대상 SQLite 저장소
+        workers: 파싱 프로세스 수 (기본: CPU 코어 수)
+        batch_size: 한 번에 처리/커밋할 파일 수
+        archive_dir: 지정 시 가져온 파일을 이 디렉터리로 이동
+
+    Returns:
+        처리 통계
+    """
+    workers = workers or os.cpu_count() or 1
+    if archive_dir:
+        Path(archive_dir).mkdir(parents=True, exist_ok=True)
+
+    stats = {"files": 0, "imported": 0, "skipped": 0, "errors": 0}
+    # 처리 중인 묶음 수 제한 (디렉터리를 앞질러 읽어 메모리가 늘어나지 않도록)
+    max_pending = workers * 2
+    start_time = time.time()
+
+    def collect(done):
+        for future in done:
+            results, files = future.result()
+            store.import_batch(results, files)
+            stats["imported"] += len(results)
+            stats["errors"] += sum(1 for _, status in files if status == "error")
+            if archive_dir:
+                archive_files(source_dir, archive_dir, [name for name, status in files if status == "ok"])
+        print(f"📦 {stats['imported']}건 가져옴 / 건너뜀 {stats['skipped']} / 오류 {stats['errors']} "
+              f"({time.time() - start_time:.1f}초)")
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for names in iter_batches(iter_result_files(source_dir), batch_size):
+            stats["files"] += len(names)
+            done_before = store.imported_names(names)
+            names = [name for name in names if name not in done_before]
+            stats["skipped"] += len(done_before)
+            if archive_dir:
+                # 이전 실행에서 커밋 후 이동 전에 중단된 파일
+                archive_files(source_dir, archive_dir,
+                              [name for name, status in done_before.items() if status == "ok"])
+            if not names:
+                continue
+
+            pending.add(executor.submit(load_batch, source_dir, names))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+
+        if pending:
+            collect(wait(pending)[0])
+
+    store.optimize()
+    stats["elapsed"] = round(time.time() - start_time, 1)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="data/json_results JSON 파일을 SQLite 결과 저장소로 가져오기")
+    parser.add_argument("--source", default="data/json_results", help="JSON 결과 디렉터리")
+    parser.add_argument("--db", default=result_db.db_path, help="결과 데이터베이스 경로")
+    parser.add_argument("--workers", type=int, default=None, help="파싱 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="한 번에 커밋할 파일 수")
+    parser.add_argument("--archive", default=None, help="가져온 원본 파일을 옮길 디렉터리")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.source):
+        print(f"❌ 디렉터리가 없습니다: {args.source}")
+        return
+
+    print("=" * 60)
+    print(f"📥 결과 가져오기: {args.source} → {args.db}")
+    print("=" * 60)
+
+    stats = import_directory(
+        args.source,
+        SQLiteResultStore(db_path=args.db),
+        workers=args.workers,
+        batch_size=max(1, args.batch_size),
+        archive_dir=args.archive
+    )
+
+    print("=" * 60)
+    print(f"✅ 완료: 파일 {stats['files']}개 / 가져옴 {stats['imported']} / "
+          f"이전에 가져옴 {stats['skipped']} / 오류 {stats['errors']} ({stats['elapsed']}초)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
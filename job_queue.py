@@ -0,0 +1,194 @@
+"""
+비동기 작업 큐
+요청에는 작업 ID만 즉시 반환하고, 크롤링은 백그라운드 워커가 순서대로 처리
+"""
+
+from collections import OrderedDict
+from datetime import datetime
+import asyncio
+import os
+import time
+import uuid
+import logging
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(Exception):
+    """작업 큐가 가득 찬 경우"""
+    pass
+
+
+class Job:
+    """단일 URL 크롤링 작업"""
+
+    def __init__(self, url: str, force_refresh: bool, max_age: Optional[int], seq: int):
+        self.job_id = uuid.uuid4().hex
+        self.url = url
+        self.force_refresh = force_refresh
+        self.max_age = max_age
+        self.seq = seq  # 큐 진입 순번 (대기 순서 계산용)
+        self.status = "queued"  # queued / running / done / failed
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.error = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed")
+
+
+def _format_time(ts: Optional[float]) -> Optional[str]:
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S')
+
+
+class JobManager:
+    """작업 큐 및 워커 관리 클래스"""
+
+    def __init__(self, max_queue=1000, retention=3600, max_jobs=100000):
+        """
+        Args:
+            max_queue: 대기 가능한 최대 작업 수 (초과 시 QueueFullError)
+            retention: 완료된 작업 결과 보관 시간 (초)
+            max_jobs: 메모리에 보관할 최대 작업 수
+        """
+        self.max_queue = max_queue
+        self.retention = retention
+        self.max_jobs = max_jobs
+        self.queue = None
+        self.jobs = OrderedDict()
+        self.workers = []
+        self.handler = None
+        self._enqueued = 0
+        self._dequeued = 0
+
+    def start(self, handler, workers: int):
+        """
+        워커 시작 (이벤트 루프 안에서 호출)
+
+        Args:
+            handler: async def handler(url, force_refresh, max_age) -> dict
+            workers: 워커 개수 (드라이버 풀 크기와 동일하게 사용)
+        """
+        self.handler = handler
+        self.queue = asyncio.Queue(maxsize=self.max_queue)
+        self.workers = [
+            asyncio.ensure_future(self._worker(i + 1))
+            for i in range(max(1, workers))
+        ]
+        logger.info(f"작업 큐 시작 (워커: {len(self.workers)}개, 최대 대기: {self.max_queue}개)")
+
+    async def stop(self):
+        """워커 종료"""
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+        logger.info("작업 큐 종료")
+
+    def free_slots(self) -> int:
+        """큐에 추가로 넣을 수 있는 작업 수"""
+        if self.queue is None:
+            return 0
+        return self.max_queue - self.queue.qsize()
+
+    def submit(self, url: str, force_refresh: bool = False, max_age: Optional[int] = None) -> Job:
+        """
+        작업 등록
+
+        Raises:
+            QueueFullError: 큐가 가득 찬 경우
+        """
+        if self.queue is None:
+            raise QueueFullError("작업 큐가 시작되지 않았습니다")
+
+        self._prune()
+        job = Job(url, force_refresh, max_age, seq=self._enqueued)
+        try:
+            self.queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise QueueFullError(f"작업 큐가 가득 찼습니다 (최대 {self.max_queue}개)")
+
+        self._enqueued += 1
+        self.jobs[job.job_id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self.jobs.get(job_id)
+
+    def position(self, job: Job) -> Optional[int]:
+        """대기 순서 (1 = 다음 차례, 대기 중이 아니면 None)"""
+        if job.status != "queued":
+            return None
+        return job.seq - self._dequeued + 1
+
+    def to_dict(self, job: Job) -> Dict:
+        return {
+            "job_id": job.job_id,
+            "url": job.url,
+            "status": job.status,
+            "queue_position": self.position(job),
+            "created_at": _format_time(job.created_at),
+            "started_at": _format_time(job.started_at),
+            "finished_at": _format_time(job.finished_at),
+            "result": job.result,
+            "error": job.error
+        }
+
+    def stats(self) -> Dict:
+        """작업 큐 상태 (상태 조회용)"""
+        counts = {"queued": 0, "running": 0, "done": 0, "failed": 0}
+        for job in self.jobs.values():
+            counts[job.status] += 1
+        return {
+            "queue_size": self.queue.qsize() if self.queue else 0,
+            "max_queue": self.max_queue,
+            "workers": len(self.workers),
+            **counts
+        }
+
+    async def _worker(self, index: int):
+        while True:
+            job = await self.queue.get()
+            self._dequeued += 1
+            job.status = "running"
+            job.started_at = time.time()
+            try:
+                job.result = await self.handler(job.url, job.force_refresh, job.max_age)
+                job.status = "done"
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # HTTPException은 detail, 그 외는 메시지 사용
+                job.error = str(getattr(e, "detail", None) or e)
+                job.status = "failed"
+                logger.warning(f"작업 실패 (워커 {index}): {job.url} - {job.error}")
+            finally:
+                job.finished_at = time.time()
+                self.queue.task_done()
+
+    def _prune(self):
+        """
+        보관 기간이 지났거나 개수를 초과한 완료 작업 정리
+        (등록 순서상 앞쪽부터 확인하므로 호출 비용이 작음)
+        """
+        now = time.time()
+        while self.jobs:
+            job_id, job = next(iter(self.jobs.items()))
+            if not job.finished:
+                break
+            if now - job.finished_at <= self.retention and len(self.jobs) < self.max_jobs:
+                break
+            del self.jobs[job_id]
+
+
+# 글로벌 작업 관리자 인스턴스
+job_manager = JobManager(
+    max_queue=int(os.getenv("JOB_QUEUE_SIZE", 1000)),
+    retention=int(os.getenv("JOB_RETENTION", 3600))
+)
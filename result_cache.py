@@ -0,0 +1,109 @@
+"""
+등급 조회 결과 캐시
+같은 블로그를 짧은 시간 안에 다시 조회할 때 크롤링 없이 결과를 반환
+"""
+
+from collections import OrderedDict
+import os
+import threading
+import time
+import logging
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """블로그 ID 기준 TTL + LRU 결과 캐시"""
+
+    def __init__(self, ttl=86400, max_size=10000):
+        """
+        Args:
+            ttl: 캐시 유효 시간 (초, 기본 24시간)
+            max_size: 최대 보관 개수 (초과 시 가장 오래 안 쓴 항목부터 제거)
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, blog_id: str, max_age: Optional[float] = None) -> Optional[Dict]:
+        """
+        캐시된 결과 조회
+
+        Args:
+            blog_id: 블로그 ID
+            max_age: 허용할 최대 경과 시간 (초, None이면 TTL 기준)
+
+        Returns:
+            결과 딕셔너리 복사본 또는 None
+        """
+        limit = self.ttl if max_age is None else min(max_age, self.ttl)
+
+        with self.lock:
+            entry = self._entries.get(blog_id)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            stored_at, data = entry
+            age = time.time() - stored_at
+            if age > self.ttl:
+                # 만료된 항목은 즉시 제거
+                del self._entries[blog_id]
+                self.misses += 1
+                return None
+            if age > limit:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(blog_id)
+            self.hits += 1
+            return dict(data)
+
+    def set(self, blog_id: str, data: Dict):
+        """
+        결과 저장 (성공한 결과만 저장하는 것은 호출자 책임)
+
+        Args:
+            blog_id: 블로그 ID
+            data: 결과 딕셔너리
+        """
+        if self.max_size <= 0:
+            return
+
+        with self.lock:
+            self._entries[blog_id] = (time.time(), dict(data))
+            self._entries.move_to_end(blog_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, blog_id: str):
+        """특정 블로그 캐시 제거"""
+        with self.lock:
+            self._entries.pop(blog_id, None)
+
+    def clear(self):
+        """전체 캐시 제거"""
+        with self.lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """캐시 통계 (상태 조회용)"""
+        with self.lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+
+# 글로벌 결과 캐시 인스턴스
+result_cache = ResultCache(
+    ttl=int(os.getenv("RESULT_CACHE_TTL", 86400)),
+    max_size=int(os.getenv("RESULT_CACHE_SIZE", 10000))
+)
@@ -1,15 +1,27 @@
 """
 공유 결과 저장 모듈
-크롤링 결과를 JSON 파일로 저장하고 등급 정보를 관리
+크롤링 결과를 저장소(SQLite 또는 JSON 파일)에 저장하고 등급 정보를 관리
 """
 
 import json
 import os
+import queue
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from urllib.parse import urlparse
+from urllib.parse import parse_qsl, urlparse
 from typing import Dict, Optional
 
+from sqlite_store import result_db
+
+# 결과 저장 방식
+# - "sqlite": data/results.db 한 파일에 저장 (기본, blog_id/시각 인덱스)
+# - "json": 크롤링마다 data/json_results/ 아래 JSON 파일 생성 (이전 방식)
+# RESULT_JSON_EXPORT=true면 sqlite 저장과 함께 JSON 파일도 생성
+RESULT_BACKEND = os.getenv("RESULT_BACKEND", "sqlite").lower()
+RESULT_JSON_EXPORT = os.getenv("RESULT_JSON_EXPORT", "false").lower() == "true"
+
 # 등급 매핑 데이터 (blogdex_selenium_login.py에서 이동)
 GRADE_MAPPING = {
     "일반": {
@@ -208,13 +220,112 @@ def get_level_info(grade: str) -> Optional[Dict]:
         return None
 
 
+# API 응답에서 등급을 읽을 필드 이름 (응답 전체에서 아무 문자열이나 찾지 않음)
+GRADE_FIELDS = ("grade", "blogGrade", "blog_grade", "gradeName", "grade_name")
+
+
+def url_refers_to_blog(url: str, blog_id: str) -> bool:
+    """
+    URL이 해당 블로그를 가리키는지 확인
+    (경로 구간 또는 쿼리 값이 blog_id와 정확히 같거나, 쿼리 값이 그 블로그의 URL인 경우)
+    """
+    if not url or not blog_id:
+        return False
+    parsed = urlparse(url)
+    if blog_id in parsed.path.split('/'):
+        return True
+    for _, value in parse_qsl(parsed.query):
+        if value == blog_id or ("blog.naver.com" in value and build_blog_id(value) == blog_id):
+            return True
+    return False
+
+
+def _refers_to_blog(node: Dict, blog_id: str) -> bool:
+    """dict의 값(한 단계 아래 dict 포함) 중 blog_id 또는 그 블로그 URL이 있는지 확인"""
+    values = list(node.values())
+    for value in node.values():
+        if isinstance(value, dict):
+            values.extend(value.values())
+    for value in values:
+        if isinstance(value, str) and (value == blog_id or url_refers_to_blog(value, blog_id)):
+            return True
+    return False
+
+
+def find_grade_in_payload(payload, blog_id: str, scoped: bool = False) -> Optional[str]:
+    """
+    API 응답 JSON에서 요청한 블로그의 등급 필드 값 추출
+
+    Args:
+        payload: json.loads 결과 (dict / list / 값)
+        blog_id: 요청한 블로그 ID (이 블로그를 가리키는 객체와 그 하위에서만 등급을 읽음)
+        scoped: 응답 URL이 이미 이 블로그를 가리키는 경우 True (응답 전체가 이 블로그의 데이터)
+
+    Returns:
+        등급 문자열 (GRADE_FIELDS 필드 값 중 GRADE_MAPPING에 있는 것) 또는 None
+    """
+    stack = [(payload, scoped)]
+    while stack:
+        node, matched = stack.pop(0)
+        if isinstance(node, dict):
+            matched = matched or _refers_to_blog(node, blog_id)
+            if matched:
+                for field in GRADE_FIELDS:
+                    value = node.get(field)
+                    if isinstance(value, str) and value.strip() in GRADE_MAPPING:
+                        return value.strip()
+            stack.extend((value, matched) for value in node.values())
+        elif isinstance(node, list):
+            stack.extend((value, matched) for value in node)
+    return None
+
+
 def persist_result(data: Dict, output_dir: str = "data/json_results") -> Optional[str]:
+    """
+    크롤링 결과 저장 (RESULT_BACKEND에 따라 SQLite 또는 JSON 파일)
+
+    Args:
+        data: 저장할 결과 데이터
+        output_dir: JSON 파일 저장 디렉토리
+
+    Returns:
+        저장 위치 (JSON 파일 경로 또는 데이터베이스 경로) 또는 None
+    """
+    json_path = None
+    if RESULT_BACKEND == "json" or RESULT_JSON_EXPORT:
+        json_path = export_json(data, output_dir)
+    if RESULT_BACKEND == "json":
+        return json_path
+
+    try:
+        result_db.write(data)
+    except Exception as e:
+        print(f"❌ 결과 저장 실패: {e}")
+        return json_path
+    return json_path or result_db.db_path
+
+
+def json_result_path(data: Dict, output_dir: str = "data/json_results") -> str:
+    """결과 JSON 파일 경로 ({blog_id}_grade_{타임스탬프}.json)"""
+    # 블로그 ID 추출
+    blog_id = data.get('blog_id') or build_blog_id(data.get('url', ''))
+
+    # 타임스탬프 생성
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+    # 파일명 생성
+    filename = f"{blog_id}_grade_{timestamp}.json"
+    return os.path.join(output_dir, filename)
+
+
+def export_json(data: Dict, output_dir: str = "data/json_results", filepath: Optional[str] = None) -> Optional[str]:
     """
     크롤링 결과를 JSON 파일로 저장 (원자적 쓰기)
 
     Args:
         data: 저장할 결과 데이터
         output_dir: 저장 디렉토리
+        filepath: 저장할 파일 경로 (None이면 json_result_path로 생성)
 
     Returns:
         저장된 파일 경로 또는 None
@@ -223,15 +334,7 @@ def persist_result(data: Dict, output_dir: str = "data/json_results") -> Optiona
         # 디렉토리 생성 (존재하지 않으면)
         Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-        # 블로그 ID 추출
-        blog_id = data.get('blog_id') or build_blog_id(data.get('url', ''))
-
-        # 타임스탬프 생성
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-
-        # 파일명 생성
-        filename = f"{blog_id}_grade_{timestamp}.json"
-        filepath = os.path.join(output_dir, filename)
+        filepath = filepath or json_result_path(data, output_dir)
 
         # 임시 파일에 쓰기 (원자적 쓰기)
         temp_filepath = filepath + ".tmp"
@@ -250,6 +353,138 @@ def persist_result(data: Dict, output_dir: str = "data/json_results") -> Optiona
         return None
 
 
+class ResultWriter:
+    """
+    결과 저장 전용 백그라운드 스레드 (write-behind)
+    크롤링 스레드는 큐에 넣기만 하고, 저장 스레드가 모아서 한 트랜잭션으로 기록
+    """
+
+    def __init__(self, max_queue=10000, batch_size=200, flush_interval=1.0):
+        """
+        Args:
+            max_queue: 저장 대기 최대 건수 (가득 차면 호출 스레드에서 바로 저장)
+            batch_size: 한 번에 기록할 최대 건수
+            flush_interval: 결과가 적을 때 모아서 기록하는 최대 대기 시간 (초)
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.thread = None
+        self._stop = threading.Event()
+        self.written = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        """저장 스레드 시작 (서버 시작 시 1회)"""
+        if self.running:
+            return
+        self._stop.clear()
+        self.thread = threading.Thread(target=self._run, name="result-writer", daemon=True)
+        self.thread.start()
+
+    def submit(self, data: Dict, json_path: Optional[str] = None):
+        """
+        저장 요청 (큐가 가득 차면 호출 스레드에서 바로 저장하여 결과 유실 방지)
+        """
+        try:
+            self.queue.put_nowait((data, json_path))
+        except queue.Full:
+            print("⚠️ 결과 저장 대기열 가득 참 - 바로 저장")
+            self._write_batch([(data, json_path)])
+
+    def _run(self):
+        while not (self._stop.is_set() and self.queue.empty()):
+            try:
+                batch = [self.queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            # 이미 쌓여 있는 결과를 batch_size까지 함께 기록
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    def _write_batch(self, batch):
+        for data, json_path in batch:
+            if json_path:
+                export_json(data, os.path.dirname(json_path), json_path)
+        if RESULT_BACKEND == "json":
+            self.written += len(batch)
+            return
+        try:
+            self.written += result_db.write_many([data for data, _ in batch])
+        except Exception as e:
+            self.failed += len(batch)
+            print(f"❌ 결과 저장 실패 ({len(batch)}건): {e}")
+
+    def flush(self, timeout: float = 30) -> bool:
+        """
+        대기 중인 결과를 모두 기록할 때까지 대기
+
+        Returns:
+            시간 안에 모두 기록했는지 여부
+        """
+        if not self.running:
+            return self.queue.empty()
+        deadline = time.time() + timeout
+        while self.queue.unfinished_tasks and time.time() < deadline:
+            time.sleep(0.05)
+        return self.queue.unfinished_tasks == 0
+
+    def close(self, timeout: float = 30):
+        """남은 결과를 기록하고 저장 스레드 종료 (서버 종료 시)"""
+        self.flush(timeout)
+        self._stop.set()
+        if self.thread is not None:
+            self.thread.join(timeout=self.flush_interval + 1)
+            self.thread = None
+
+    def stats(self) -> Dict:
+        """저장 스레드 상태 (상태 조회용)"""
+        return {
+            "running": self.running,
+            "pending": self.queue.qsize(),
+            "written": self.written,
+            "failed": self.failed
+        }
+
+
+# 글로벌 결과 저장 스레드 인스턴스
+result_writer = ResultWriter(
+    max_queue=int(os.getenv("RESULT_QUEUE_SIZE", 10000)),
+    batch_size=int(os.getenv("RESULT_BATCH_SIZE", 200))
+)
+
+
+def persist_result_async(data: Dict, output_dir: str = "data/json_results") -> Optional[str]:
+    """
+    크롤링 결과 저장 요청 (저장 스레드가 실행 중이면 큐에 넣고 바로 반환, 아니면 바로 저장)
+
+    Returns:
+        저장될 위치 (JSON 파일 경로 또는 데이터베이스 경로)
+    """
+    if not result_writer.running:
+        return persist_result(data, output_dir)
+
+    json_path = None
+    if RESULT_BACKEND == "json" or RESULT_JSON_EXPORT:
+        json_path = json_result_path(data, output_dir)
+    result_writer.submit(dict(data), json_path)
+    if RESULT_BACKEND == "json":
+        return json_path
+    return json_path or result_db.db_path
+
+
 def enrich_result(url: str, grade: Optional[str], success: bool, error: Optional[str] = None) -> Dict:
     """
     크롤링 결과를 메타데이터로 보강
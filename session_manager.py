@@ -0,0 +1,145 @@
+"""
+BlogDex 로그인 세션 관리
+세션이 만료되면 드라이버 1개에서만 재로그인하고, 새 쿠키를 나머지 드라이버와 HTTP 클라이언트에 전파
+(드라이버마다 따로 로그인을 시도하거나 폐기되어 풀이 줄어드는 것을 방지)
+"""
+
+from pathlib import Path
+import os
+import pickle
+import threading
+import time
+import logging
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from crawler import perform_login, verify_login_status
+from http_client import blogdex_http
+
+logger = logging.getLogger(__name__)
+
+
+BLOGDEX_HOME = "https://blogdex.space/"
+
+
+class SessionManager:
+    """재로그인 단일화 및 쿠키 전파 관리 클래스"""
+
+    def __init__(self, cookie_path="cookies.pkl", login_cooldown=300):
+        """
+        Args:
+            cookie_path: 세션 쿠키 파일 경로
+            login_cooldown: 재로그인 실패 후 다시 시도하기까지 대기 시간 (초)
+        """
+        self.cookie_path = cookie_path
+        self.login_cooldown = login_cooldown
+        # 재로그인은 한 번에 하나만 (대기하던 호출자는 새 쿠키만 적용)
+        self.lock = threading.Lock()
+        # 재로그인할 때마다 증가 (드라이버가 가진 쿠키가 최신인지 비교용)
+        self.generation = 0
+        self.logins = 0
+        self._cookies = None
+        self._cookie_mtime = None
+        self._last_failure = 0
+
+    def _load_cookies(self):
+        """쿠키 파일을 읽어 메모리에 보관 (파일이 바뀐 경우에만 다시 읽음)"""
+        cookie_file = Path(self.cookie_path)
+        if not cookie_file.exists():
+            return self._cookies
+        mtime = cookie_file.stat().st_mtime
+        if mtime != self._cookie_mtime:
+            with open(cookie_file, 'rb') as f:
+                self._cookies = pickle.load(f)
+            self._cookie_mtime = mtime
+        return self._cookies
+
+    def apply_cookies(self, driver) -> bool:
+        """
+        현재 세션 쿠키를 드라이버에 주입하고 제자리 새로고침
+
+        Returns:
+            적용 후 로그인 확인 여부
+        """
+        cookies = self._load_cookies()
+        if not cookies:
+            return False
+
+        try:
+            # add_cookie는 같은 도메인에 있어야 하므로 BlogDex 밖이면 먼저 이동
+            if "blogdex.space" not in driver.current_url:
+                driver.get(BLOGDEX_HOME)
+            for cookie in cookies:
+                try:
+                    driver.add_cookie(cookie)
+                except:
+                    pass
+            driver.refresh()
+            WebDriverWait(driver, 10).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+            return verify_login_status(driver)
+        except Exception as e:
+            logger.warning(f"⚠️ 세션 쿠키 적용 실패: {str(e)[:60]}")
+            return False
+
+    def ensure_login(self, driver, known_generation: int) -> bool:
+        """
+        드라이버 로그인 세션 복구
+
+        다른 드라이버가 이미 재로그인했으면(known_generation < generation) 쿠키만 적용하고,
+        그렇지 않으면 이 드라이버로 한 번만 재로그인
+
+        Args:
+            driver: 세션이 만료된 드라이버
+            known_generation: 드라이버가 마지막으로 받은 세션 세대
+
+        Returns:
+            로그인 상태 복구 여부
+        """
+        if known_generation < self.generation and self.apply_cookies(driver):
+            return True
+
+        with self.lock:
+            # 잠금을 기다리는 동안 다른 드라이버가 재로그인을 끝낸 경우
+            if known_generation < self.generation:
+                return self.apply_cookies(driver)
+
+            if time.time() - self._last_failure < self.login_cooldown:
+                logger.warning("⚠️ 최근 재로그인 실패 - 잠시 후 다시 시도")
+                return False
+
+            logger.info("🔑 세션 만료 - 재로그인 시작")
+            try:
+                if "blogdex.space" not in driver.current_url:
+                    driver.get(BLOGDEX_HOME)
+                success = perform_login(driver, self.cookie_path)
+            except Exception as e:
+                logger.error(f"❌ 재로그인 실패: {e}")
+                success = False
+
+            if not success:
+                self._last_failure = time.time()
+                return False
+
+            self.generation += 1
+            self.logins += 1
+            self._load_cookies()
+            # HTTP 빠른 조회 클라이언트도 새 쿠키 사용
+            blogdex_http.reload_cookies()
+            logger.info(f"✅ 재로그인 완료 (세션 세대: {self.generation})")
+            return True
+
+    def stats(self):
+        """세션 상태 (상태 조회용)"""
+        return {
+            "generation": self.generation,
+            "logins": self.logins,
+            "cookie_file": os.path.exists(self.cookie_path)
+        }
+
+
+# 글로벌 세션 관리자 인스턴스
+session_manager = SessionManager(
+    login_cooldown=int(os.getenv("LOGIN_COOLDOWN", 300))
+)
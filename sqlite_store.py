@@ -0,0 +1,256 @@
+"""
+SQLite 결과 저장소
+크롤링 결과를 WAL 모드 SQLite 한 파일에 저장하고 (blog_id, timestamp) 인덱스로 조회
+(크롤링마다 JSON 파일을 만들던 방식 대체, JSON 파일은 선택적 내보내기로 유지)
+"""
+
+from pathlib import Path
+import json
+import os
+import sqlite3
+import threading
+import logging
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# 결과 컬럼 (enrich_result 스키마 + 원본 응답)
+RESULT_COLUMNS = [
+    "blog_id", "url", "grade", "level", "level_en", "tier", "tier_en",
+    "tier_rank", "success", "error", "timestamp", "raw"
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    blog_id TEXT NOT NULL,
+    url TEXT,
+    grade TEXT,
+    level TEXT,
+    level_en TEXT,
+    tier TEXT,
+    tier_en TEXT,
+    tier_rank INTEGER,
+    success INTEGER NOT NULL,
+    error TEXT,
+    timestamp TEXT NOT NULL,
+    raw TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_results_blog_time ON results (blog_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_results_time ON results (timestamp);
+CREATE TABLE IF NOT EXISTS imported_files (
+    name TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    imported_at TEXT NOT NULL DEFAULT (datetime('now', 'localtime'))
+);
+"""
+
+
+def _to_row(data: Dict) -> tuple:
+    raw = data.get("raw")
+    return (
+        data.get("blog_id"),
+        data.get("url"),
+        data.get("grade"),
+        data.get("level"),
+        data.get("level_en"),
+        data.get("tier"),
+        data.get("tier_en"),
+        data.get("tier_rank"),
+        1 if data.get("success") else 0,
+        data.get("error"),
+        data.get("timestamp"),
+        json.dumps(raw, ensure_ascii=False) if raw is not None else None
+    )
+
+
+def _to_dict(row: sqlite3.Row) -> Dict:
+    result = {column: row[column] for column in RESULT_COLUMNS}
+    result["success"] = bool(result["success"])
+    if result["raw"] is not None:
+        result["raw"] = json.loads(result["raw"])
+    return result
+
+
+class SQLiteResultStore:
+    """SQLite 결과 저장소 클래스 (스레드별 연결 사용)"""
+
+    def __init__(self, db_path="data/results.db"):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로
+        """
+        self.db_path = db_path
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 (없으면 생성)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+        return conn
+
+    def _open(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        """새 연결 생성 (최초 1회 스키마 생성)"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=check_same_thread)
+        conn.row_factory = sqlite3.Row
+        # WAL: 쓰는 동안에도 조회 가능, NORMAL: 커밋마다 fsync하지 않음 (WAL 체크포인트 시 동기화)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        with self._init_lock:
+            if not self._initialized:
+                conn.executescript(SCHEMA)
+                self._initialized = True
+        return conn
+
+    def write_many(self, results: List[Dict]) -> int:
+        """
+        결과 여러 건을 한 트랜잭션으로 저장
+
+        Returns:
+            저장한 건수
+        """
+        if not results:
+            return 0
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                f"INSERT INTO results ({', '.join(RESULT_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in RESULT_COLUMNS)})",
+                [_to_row(data) for data in results]
+            )
+        return len(results)
+
+    def write(self, data: Dict) -> int:
+        return self.write_many([data])
+
+    def imported_names(self, names: List[str]) -> Dict[str, str]:
+        """이미 가져온 JSON 파일 이름과 상태 (import_results.py 재개용)"""
+        if not names:
+            return {}
+        conn = self._connect()
+        found = {}
+        # SQLite 변수 개수 제한(999)을 넘지 않도록 나눠서 조회
+        for i in range(0, len(names), 900):
+            chunk = names[i:i + 900]
+            rows = conn.execute(
+                f"SELECT name, status FROM imported_files WHERE name IN ({', '.join('?' for _ in chunk)})", chunk
+            ).fetchall()
+            found.update((row[0], row[1]) for row in rows)
+        return found
+
+    def import_batch(self, results: List[Dict], files: List[tuple]) -> int:
+        """
+        가져온 결과와 파일 처리 기록을 한 트랜잭션으로 저장 (중단 후 재실행 시 중복 없음)
+
+        Args:
+            results: 정규화된 결과 목록
+            files: (파일 이름, 상태) 목록 - 상태는 "ok" 또는 "error"
+        """
+        conn = self._connect()
+        with conn:
+            if results:
+                conn.executemany(
+                    f"INSERT INTO results ({', '.join(RESULT_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' for _ in RESULT_COLUMNS)})",
+                    [_to_row(data) for data in results]
+                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO imported_files (name, status) VALUES (?, ?)", files
+            )
+        return len(results)
+
+    def optimize(self):
+        """대량 입력 후 통계 갱신 및 WAL 정리"""
+        conn = self._connect()
+        conn.execute("ANALYZE")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def latest(self, blog_id: str, success_only: bool = True) -> Optional[Dict]:
+        """블로그의 가장 최근 결과 (인덱스 역순 조회 1건)"""
+        query = "SELECT * FROM results WHERE blog_id = ?"
+        if success_only:
+            query += " AND success = 1"
+        query += " ORDER BY timestamp DESC, id DESC LIMIT 1"
+        row = self._connect().execute(query, (blog_id,)).fetchone()
+        return _to_dict(row) if row else None
+
+    def history(self, blog_id: str, start: Optional[str] = None, end: Optional[str] = None,
+                success_only: bool = False, limit: Optional[int] = None) -> List[Dict]:
+        """
+        블로그의 결과 이력 (시간 오름차순)
+
+        Args:
+            start / end: 조회 구간 ('YYYY-MM-DD HH:MM:SS' 또는 그 앞부분, end 포함)
+            success_only: 성공한 결과만
+            limit: 최근 N건만
+        """
+        conditions, params = self._time_filter(start, end)
+        conditions.insert(0, "blog_id = ?")
+        params.insert(0, blog_id)
+        if success_only:
+            conditions.append("success = 1")
+
+        query = f"SELECT * FROM results WHERE {' AND '.join(conditions)} ORDER BY timestamp DESC, id DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        rows = self._connect().execute(query, params).fetchall()
+        return [_to_dict(row) for row in reversed(rows)]
+
+    def iter_rows(self, start: Optional[str] = None, end: Optional[str] = None,
+                  tier: Optional[str] = None, success: Optional[bool] = None,
+                  batch_size: int = 5000) -> Iterator[List[Dict]]:
+        """
+        조건에 맞는 결과를 batch_size건씩 나눠서 반환 (전체를 메모리에 올리지 않음)
+        """
+        conditions, params = self._time_filter(start, end)
+        if tier:
+            conditions.append("(tier = ? OR tier_en = ?)")
+            params += [tier, tier]
+        if success is not None:
+            conditions.append("success = ?")
+            params.append(1 if success else 0)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        # 내보내기 전용 연결 (스레드별 캐시 연결을 쓰면 스트리밍 응답을 이어 읽은 스레드마다 연결이 남음)
+        # 묶음마다 다른 스레드가 이어서 읽으므로 스레드 검사 해제 (동시 사용은 없음), 끝나면 항상 닫음
+        conn = self._open(check_same_thread=False)
+        try:
+            cursor = conn.execute(f"SELECT * FROM results {where} ORDER BY timestamp, id", params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield [_to_dict(row) for row in rows]
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _time_filter(start: Optional[str], end: Optional[str]):
+        conditions, params = [], []
+        if start:
+            conditions.append("timestamp >= ?")
+            params.append(start)
+        if end:
+            # 날짜만 주면 그날 끝까지 포함
+            conditions.append("timestamp <= ?")
+            params.append(end if len(end) > 10 else f"{end} 23:59:59")
+        return conditions, params
+
+    def close(self):
+        """현재 스레드의 연결 종료"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+# 글로벌 결과 저장소 인스턴스
+result_db = SQLiteResultStore(db_path=os.getenv("RESULT_DB_PATH", "data/results.db"))
@@ -0,0 +1,229 @@
+"""
+탭 단위 드라이버 공유
+로그인된 Chrome 1개에 탭 여러 개를 열어 조회 여러 건을 동시에 처리
+(드라이버는 driver_pool에서 기한 있는 대여로 빌려오고, 모든 탭이 비면 다시 반환)
+"""
+
+import os
+import threading
+import time
+import logging
+
+from driver_pool import driver_pool, LeaseExpired
+from crawler import apply_resource_blocking
+
+logger = logging.getLogger(__name__)
+
+# 탭 반환 시 about:blank 이동을 위한 잠금 대기 시간 (초)
+RELEASE_LOCK_TIMEOUT = 10
+
+
+class SharedBrowser:
+    """탭을 나눠 쓰는 드라이버 1개"""
+
+    def __init__(self, lease, handles):
+        # driver_pool 대여 (기한은 사용 중인 탭 중 가장 늦은 마감으로 연장)
+        self.lease = lease
+        self.driver = lease.driver
+        self.handles = list(handles)
+        self.free = list(handles)
+        self.active = 0
+        # WebDriver 세션은 한 번에 한 명령만 처리하고 활성 탭도 하나뿐이므로
+        # 탭 전환 + 명령 실행 구간은 이 잠금 안에서 수행
+        self.lock = threading.Lock()
+
+
+class TabLease:
+    """빌려간 탭 1개"""
+
+    def __init__(self, tab_pool, browser, handle, deadline=None):
+        self.tab_pool = tab_pool
+        self.browser = browser
+        self.handle = handle
+        self.deadline = deadline
+
+    @property
+    def driver(self):
+        return self.browser.driver
+
+    def run(self, fn, *args, timeout=None):
+        """
+        이 탭으로 전환한 뒤 fn(driver, *args) 실행 (브라우저 잠금 보유)
+        짧은 명령 묶음 단위로 호출해야 다른 탭이 기다리지 않음
+
+        Args:
+            timeout: 잠금 대기 시간 (초, 기본: 탭 대여의 남은 시간, 기한 없으면 무제한)
+
+        Raises:
+            LeaseExpired: 잠금을 기한 안에 얻지 못한 경우
+        """
+        if timeout is None:
+            timeout = self.remaining()
+        if timeout is None:
+            acquired = self.browser.lock.acquire()
+        else:
+            acquired = timeout > 0 and self.browser.lock.acquire(timeout=timeout)
+        if not acquired:
+            raise LeaseExpired("탭 대여 기한 안에 브라우저 잠금을 얻지 못했습니다")
+        try:
+            self.browser.driver.switch_to.window(self.handle)
+            return fn(self.browser.driver, *args)
+        finally:
+            self.browser.lock.release()
+
+    def remaining(self):
+        """남은 시간 (초, 기한 없으면 None)"""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.time()
+
+    def check(self):
+        """
+        기한 확인 (탭 동작 사이에 호출)
+
+        Raises:
+            LeaseExpired: 기한 초과 시
+        """
+        if self.browser.lease.revoked:
+            raise LeaseExpired("드라이버가 풀에 회수되었습니다")
+        if self.deadline is not None and time.time() > self.deadline:
+            raise LeaseExpired("탭 대여 기한 초과")
+
+    def release(self):
+        self.tab_pool.release(self)
+
+
+class TabPool:
+    """탭 단위 대여 관리 클래스"""
+
+    def __init__(self, tabs_per_driver=4):
+        """
+        Args:
+            tabs_per_driver: 드라이버 1개당 열어둘 탭 수
+        """
+        self.tabs_per_driver = max(1, tabs_per_driver)
+        self.browsers = []
+        self.cond = threading.Condition()
+        self.borrowing = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.tabs_per_driver > 1
+
+    def acquire(self, timeout=30, deadline=None) -> TabLease:
+        """
+        빈 탭 대여 (없으면 driver_pool에서 드라이버를 빌려 탭을 엶)
+
+        Args:
+            timeout: 탭 대기 시간 (초)
+            deadline: 작업 마감 시각 (epoch 초, TabLease.check()에서 확인)
+
+        Raises:
+            LeaseExpired: 탭을 받기 전에 이미 마감이 지난 경우
+            TimeoutError: 타임아웃 시
+        """
+        if deadline is not None and time.time() > deadline:
+            raise LeaseExpired("탭을 받기 전에 작업 기한이 지났습니다")
+        wait_until = time.time() + timeout
+
+        with self.cond:
+            while True:
+                for browser in self.browsers:
+                    if browser.free and not browser.lease.revoked:
+                        browser.active += 1
+                        self._extend_deadline(browser, deadline)
+                        return TabLease(self, browser, browser.free.pop(), deadline)
+
+                remaining = wait_until - time.time()
+                if remaining <= 0:
+                    raise TimeoutError(f"빈 탭을 {timeout}초 동안 얻지 못했습니다")
+
+                if self.borrowing == 0:
+                    break
+                # 다른 스레드가 드라이버를 빌려오는 중이면 그 탭을 기다림
+                self.cond.wait(min(remaining, 0.5))
+
+            self.borrowing += 1
+
+        browser = None
+        try:
+            driver_lease = driver_pool.acquire(timeout=max(0.1, wait_until - time.time()), deadline=deadline)
+            try:
+                browser = self._open_tabs(driver_lease)
+            except Exception:
+                driver_lease.release()
+                raise
+        finally:
+            with self.cond:
+                self.borrowing -= 1
+                if browser is not None:
+                    browser.active += 1
+                    handle = browser.free.pop()
+                    self.browsers.append(browser)
+                self.cond.notify_all()
+
+        return TabLease(self, browser, handle, deadline)
+
+    @staticmethod
+    def _extend_deadline(browser, deadline):
+        """드라이버 대여 기한을 새 탭의 마감까지 연장 (기한 없는 탭이 있으면 기한 없음)"""
+        lease = browser.lease
+        if lease.deadline is not None and (deadline is None or deadline > lease.deadline):
+            lease.deadline = deadline
+
+    def _open_tabs(self, driver_lease):
+        """빌려온 드라이버에 탭을 추가로 열어 SharedBrowser 생성"""
+        driver = driver_lease.driver
+        handles = [driver.current_window_handle]
+        try:
+            for _ in range(self.tabs_per_driver - 1):
+                driver.switch_to.new_window('tab')
+                # 리소스 차단은 탭 단위 설정이므로 새 탭마다 적용
+                apply_resource_blocking(driver)
+                handles.append(driver.current_window_handle)
+            driver.switch_to.window(handles[0])
+        except Exception as e:
+            # 탭을 일부만 열었더라도 열린 만큼은 사용
+            logger.warning(f"⚠️ 탭 추가 실패 ({len(handles)}/{self.tabs_per_driver}개 사용): {str(e)[:60]}")
+        logger.info(f"🗂️ 드라이버 탭 {len(handles)}개 준비")
+        return SharedBrowser(driver_lease, handles)
+
+    def release(self, lease: TabLease):
+        """탭 반환 (드라이버의 모든 탭이 비면 드라이버를 driver_pool에 반환)"""
+        browser = lease.browser
+        # 이전 결과 페이지가 남아 있으면 다음 조회가 새 페이지 로딩 전에 이전 등급을 읽을 수 있으므로 비워서 반환
+        reusable = False
+        if not browser.lease.revoked:
+            try:
+                # 기한이 지난 탭도 정리는 해야 하므로 대여 기한 대신 고정 시간만 잠금 대기
+                lease.run(lambda driver: driver.get("about:blank"), timeout=RELEASE_LOCK_TIMEOUT)
+                reusable = True
+            except Exception as e:
+                logger.warning(f"⚠️ 탭 초기화 실패 - 이 탭은 더 사용하지 않음: {str(e)[:60]}")
+
+        with self.cond:
+            if reusable:
+                browser.free.append(lease.handle)
+            browser.active -= 1
+            idle = browser.active == 0
+            if idle:
+                self.browsers.remove(browser)
+            self.cond.notify_all()
+
+        if idle:
+            # 추가 탭 정리는 driver_pool의 재활용 단계에서 처리 (이미 회수된 대여면 풀이 교체)
+            browser.lease.release()
+
+    def stats(self):
+        """탭 사용 현황 (상태 조회용)"""
+        with self.cond:
+            return {
+                "tabs_per_driver": self.tabs_per_driver,
+                "browsers": len(self.browsers),
+                "active_tabs": sum(b.active for b in self.browsers),
+                "free_tabs": sum(len(b.free) for b in self.browsers)
+            }
+
+
+# 글로벌 탭 풀 인스턴스 (TABS_PER_DRIVER=1이면 비활성)
+tab_pool = TabPool(tabs_per_driver=int(os.getenv("TABS_PER_DRIVER", 1)))